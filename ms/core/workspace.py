@@ -128,7 +128,9 @@ class Workspace:
     def platformio_env_vars(self) -> dict[str, str]:
         """Get PlatformIO environment variables.
 
-        These isolate PlatformIO state to the workspace.
+        These isolate PlatformIO state to the workspace. The build cache is
+        shared by every app: SCons keys entries on the compile command and
+        source contents, so one directory serves all platforms/frameworks.
         """
         return {
             "PLATFORMIO_CORE_DIR": str(self.platformio_dir),
@@ -36,6 +36,7 @@ from ms.git.repository import (
     GitStatus,
     Repository,
     StatusEntry,
+    head_stamp,
 )
 
 __all__ = [
@@ -44,6 +45,7 @@ __all__ = [
     "GitStatus",
     "Repository",
     "StatusEntry",
+    "head_stamp",
     # Multi
     "PullResult",
     "RepoStatus",
@@ -41,6 +41,7 @@ __all__ = [
     "GitStatus",
     "Repository",
     "StatusEntry",
+    "head_stamp",
 ]
 
 
@@ -104,6 +105,7 @@ class GitStatus:
         ahead: Number of commits ahead of upstream
         behind: Number of commits behind upstream
         entries: All status entries (staged, unstaged, untracked)
+        head_sha: HEAD commit SHA, only set by Repository.status_with_head()
     """
 
     branch: str
@@ -111,6 +113,7 @@ class GitStatus:
     ahead: int = 0
     behind: int = 0
     entries: tuple[StatusEntry, ...] = field(default_factory=tuple)
+    head_sha: str | None = None
 
     @property
     def is_clean(self) -> bool:
@@ -197,6 +200,29 @@ class Repository:
             case Ok(stdout):
                 return Ok(self._parse_status(stdout))
 
+    def status_with_head(self) -> Result[GitStatus, GitError]:
+        """Get repository status including the HEAD commit SHA.
+
+        Runs `git status --porcelain=v2 --branch`, whose header carries
+        HEAD, so callers need no separate `git rev-parse HEAD`.
+
+        Returns:
+            Ok(GitStatus) with head_sha set (None before the first commit)
+            Err(GitError) on failure
+        """
+        result = self._run(["status", "--porcelain=v2", "--branch"])
+        match result:
+            case Err(e):
+                return Err(
+                    GitError(
+                        command="status",
+                        message=e.stderr.strip() or "git status failed",
+                        returncode=e.returncode,
+                    )
+                )
+            case Ok(stdout):
+                return Ok(self._parse_status_v2(stdout))
+
     def is_clean(self) -> bool:
         """Check if working tree is clean (no changes).
 
@@ -334,6 +360,63 @@ class Repository:
             entries=tuple(entries),
         )
 
+    def _parse_status_v2(self, output: str) -> GitStatus:
+        """Parse git status --porcelain=v2 --branch output."""
+        branch = ""
+        upstream: str | None = None
+        ahead = 0
+        behind = 0
+        head_sha: str | None = None
+        entries: list[StatusEntry] = []
+
+        for line in output.splitlines():
+            if line.startswith("# "):
+                key, _, value = line[2:].partition(" ")
+                if key == "branch.oid":
+                    head_sha = value if len(value) == 40 else None
+                elif key == "branch.head":
+                    branch = value
+                elif key == "branch.upstream":
+                    upstream = value
+                elif key == "branch.ab":
+                    plus, _, minus = value.partition(" ")
+                    ahead = int(plus.lstrip("+") or 0)
+                    behind = int(minus.lstrip("-") or 0)
+                continue
+
+            entry = self._parse_entry_v2(line)
+            if entry:
+                entries.append(entry)
+
+        return GitStatus(
+            branch=branch,
+            upstream=upstream,
+            ahead=ahead,
+            behind=behind,
+            entries=tuple(entries),
+            head_sha=head_sha,
+        )
+
+    def _parse_entry_v2(self, line: str) -> StatusEntry | None:
+        """Parse a porcelain v2 entry into the v1-style StatusEntry."""
+        if line.startswith("? "):
+            return StatusEntry(xy="??", path=line[2:])
+
+        # Field counts before the path: ordinary (1), rename/copy (2), unmerged (u).
+        fields_before_path = {"1": 8, "2": 9, "u": 10}.get(line[:1])
+        if fields_before_path is None:
+            return None
+        parts = line.split(" ", fields_before_path)
+        if len(parts) <= fields_before_path:
+            return None
+
+        xy = parts[1].replace(".", " ")
+        path = parts[-1]
+        if line.startswith("2 "):
+            new_path, _, orig_path = path.partition("\t")
+            path = f"{orig_path} -> {new_path}"
+        return StatusEntry(xy=xy, path=path)
+
     def _parse_branch_line(self, line: str) -> tuple[str, str | None]:
         """Parse branch line: ## branch...upstream [info]"""
         s = line.strip()
@@ -385,3 +468,28 @@ class Repository:
         path = line[3:]
 
         return StatusEntry(xy=xy, path=path)
+
+
+def head_stamp(repo_dir: Path) -> tuple[int, int] | None:
+    """Return (HEAD mtime, branch ref mtime) in ns, or None when not cheaply readable.
+
+    HEAD only changes on checkout; commits move the branch ref (loose file or
+    packed-refs), so both are needed to detect a new local commit without git.
+    """
+    git_dir = repo_dir / ".git"
+    head_path = git_dir / "HEAD"
+    try:
+        head_mtime = head_path.stat().st_mtime_ns
+        head = head_path.read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    if not head.startswith("ref: "):
+        return head_mtime, 0
+    ref_path = git_dir / head.removeprefix("ref: ")
+    for candidate in (ref_path, git_dir / "packed-refs"):
+        try:
+            return head_mtime, candidate.stat().st_mtime_ns
+        except OSError:
+            continue
+    return None
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from rich.console import Console
@@ -69,17 +70,28 @@ def detect_env(project_root: Path, explicit: str | None) -> str:
 
     ini = project_root / "platformio.ini"
     try:
-        for line in ini.read_text(encoding="utf-8", errors="replace").splitlines():
-            raw = line.strip()
-            if not raw or raw.startswith(";") or raw.startswith("#"):
-                continue
-            if raw.startswith("default_envs"):
-                _, _, rhs = raw.partition("=")
-                candidates = [candidate.strip() for candidate in rhs.split(",")]
-                for candidate in candidates:
-                    if candidate:
-                        return candidate.split()[0]
+        mtime_ns = os.stat(ini).st_mtime_ns
     except OSError:
-        pass
+        return "dev"
+    return _default_env_from_ini(str(ini), mtime_ns) or "dev"
 
-    return "dev"
+
+@lru_cache(maxsize=64)
+def _default_env_from_ini(ini: str, mtime_ns: int) -> str | None:
+    """First `default_envs` entry of a platformio.ini (cached per file version)."""
+    del mtime_ns  # cache key only
+    try:
+        text = Path(ini).read_text(encoding="utf-8", errors="replace")
+    except OSError:
+        return None
+    for line in text.splitlines():
+        raw = line.strip()
+        if not raw or raw.startswith(";") or raw.startswith("#"):
+            continue
+        if raw.startswith("default_envs"):
+            _, _, rhs = raw.partition("=")
+            candidates = [candidate.strip() for candidate in rhs.split(",")]
+            for candidate in candidates:
+                if candidate:
+                    return candidate.split()[0]
+    return None
@@ -53,6 +53,7 @@ def run(
     env: dict[str, str] | None = None,
     *,
     timeout: float | None = None,
+    input: str | None = None,
 ) -> Result[str, ProcessError]:
     """Execute a command and return stdout or error.
 
@@ -61,6 +62,7 @@ def run(
         cwd: Working directory for the command.
         env: Environment variables (uses current env if None).
         timeout: Maximum seconds to wait (None for no limit).
+        input: Text written to the command's stdin (None for no stdin data).
 
     Returns:
         Ok(stdout) on success, Err(ProcessError) on failure.
@@ -78,6 +80,7 @@ def run(
             cmd,
             cwd=str(cwd),
             env=env,
+            input=input,
             capture_output=True,
             text=True,
             encoding="utf-8",
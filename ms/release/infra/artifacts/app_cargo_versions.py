@@ -7,6 +7,12 @@ from ms.core.result import Err, Ok, Result
 from ms.platform.files import atomic_write_text
 from ms.release.errors import ReleaseError
 
+_PACKAGE_MARKER = "[package]"
+_CARGO_VERSION_RE = re.compile(r'^version\s*=\s*"([^"]+)"\s*$', re.MULTILINE)
+_CARGO_LOCK_ROOT_VERSION_RE = re.compile(
+    r'\[\[package\]\]\r?\nname = "ms-manager"\r?\nversion = "([^"]+)"'
+)
+
 
 def read_cargo_package_version(*, path: Path) -> Result[str, ReleaseError]:
     try:
@@ -20,7 +26,7 @@ def read_cargo_package_version(*, path: Path) -> Result[str, ReleaseError]:
             )
         )
 
-    pkg_idx = text.find("[package]")
+    pkg_idx = text.find(_PACKAGE_MARKER)
     if pkg_idx < 0:
         return Err(
             ReleaseError(
@@ -31,7 +37,7 @@ def read_cargo_package_version(*, path: Path) -> Result[str, ReleaseError]:
         )
 
     sub = text[pkg_idx:]
-    match = re.search(r'(?m)^version\s*=\s*"([^"]+)"\s*$', sub)
+    match = _CARGO_VERSION_RE.search(sub)
     if match is None:
         return Err(
             ReleaseError(
@@ -56,7 +62,7 @@ def write_cargo_package_version(*, path: Path, version: str) -> Result[bool, Rel
             )
         )
 
-    pkg_idx = text.find("[package]")
+    pkg_idx = text.find(_PACKAGE_MARKER)
     if pkg_idx < 0:
         return Err(
             ReleaseError(
@@ -68,7 +74,7 @@ def write_cargo_package_version(*, path: Path, version: str) -> Result[bool, Rel
 
     prefix = text[:pkg_idx]
     sub = text[pkg_idx:]
-    match = re.search(r'(?m)^version\s*=\s*"([^"]+)"\s*$', sub)
+    match = _CARGO_VERSION_RE.search(sub)
     if match is None:
         return Err(
             ReleaseError(
@@ -110,7 +116,7 @@ def read_cargo_lock_package_version(*, path: Path) -> Result[str, ReleaseError]:
             )
         )
 
-    match = re.search(r'\[\[package\]\]\r?\nname = "ms-manager"\r?\nversion = "([^"]+)"', text)
+    match = _CARGO_LOCK_ROOT_VERSION_RE.search(text)
     if match is None:
         return Err(
             ReleaseError(
@@ -135,7 +141,7 @@ def write_cargo_lock_package_version(*, path: Path, version: str) -> Result[bool
             )
         )
 
-    match = re.search(r'\[\[package\]\]\r?\nname = "ms-manager"\r?\nversion = "([^"]+)"', text)
+    match = _CARGO_LOCK_ROOT_VERSION_RE.search(text)
     if match is None:
         return Err(
             ReleaseError(
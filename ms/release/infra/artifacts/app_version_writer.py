@@ -130,39 +130,11 @@ def apply_version(*, app_repo_root: Path, version: str) -> Result[list[Path], Re
 
 
 def _read_json_version(*, path: Path) -> Result[str, ReleaseError]:
-    try:
-        text = path.read_text(encoding="utf-8")
-    except OSError as e:
-        return Err(
-            ReleaseError(
-                kind="repo_failed",
-                message=f"failed to read {path.name}: {e}",
-                hint=str(path),
-            )
-        )
-
-    try:
-        obj: object = json.loads(text)
-    except json.JSONDecodeError as e:
-        return Err(
-            ReleaseError(
-                kind="invalid_input",
-                message=f"invalid JSON in {path.name}: {e}",
-                hint=str(path),
-            )
-        )
-
-    data = as_str_dict(obj)
-    if data is None:
-        return Err(
-            ReleaseError(
-                kind="invalid_input",
-                message=f"invalid JSON root in {path.name}",
-                hint=str(path),
-            )
-        )
+    data_result = _read_json_object(path=path)
+    if isinstance(data_result, Err):
+        return data_result
 
-    value = get_str(data, "version")
+    value = get_str(data_result.value, "version")
     if value is None:
         return Err(
             ReleaseError(
@@ -206,19 +178,7 @@ def _write_json_version(*, path: Path, version: str) -> Result[bool, ReleaseErro
         return Ok(False)
 
     data["version"] = version
-
-    try:
-        atomic_write_text(path, json.dumps(data, indent=2) + "\n", encoding="utf-8")
-    except OSError as e:
-        return Err(
-            ReleaseError(
-                kind="repo_failed",
-                message=f"failed to write {path.name}: {e}",
-                hint=str(path),
-            )
-        )
-
-    return Ok(True)
+    return _write_json_object(path=path, data=data)
 
 
 def _write_package_lock_versions(*, path: Path, version: str) -> Result[bool, ReleaseError]:
@@ -249,7 +209,7 @@ def _write_package_lock_versions(*, path: Path, version: str) -> Result[bool, Re
 
 def _read_json_object(*, path: Path) -> Result[dict[str, object], ReleaseError]:
     try:
-        text = path.read_text(encoding="utf-8")
+        raw = path.read_bytes()
     except OSError as e:
         return Err(
             ReleaseError(
@@ -260,8 +220,9 @@ def _read_json_object(*, path: Path) -> Result[dict[str, object], ReleaseError]:
         )
 
     try:
-        obj: object = json.loads(text)
-    except json.JSONDecodeError as e:
+        # json decodes UTF-8 bytes itself; no intermediate str copy.
+        obj: object = json.loads(raw)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
         return Err(
             ReleaseError(
                 kind="invalid_input",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import random
 import time
 from pathlib import Path
 
@@ -12,7 +13,16 @@ from ms.release.infra.github.timeouts import GH_TIMEOUT_SECONDS
 
 _MERGEABLE_WAIT_SECONDS = 15 * 60
 _MERGE_WAIT_SECONDS = 10 * 60
-_POLL_SECONDS = 5
+_POLL_MIN_SECONDS = 2.0
+_POLL_MAX_SECONDS = 20.0
+_POLL_BACKOFF = 1.5
+_POLL_JITTER_SECONDS = 0.5
+
+
+def _poll_delay(attempt: int) -> float:
+    """Backoff between PR polls; `attempt` restarts at 0 when the PR state changes."""
+    base = min(_POLL_MAX_SECONDS, _POLL_MIN_SECONDS * _POLL_BACKOFF**attempt)
+    return base + random.uniform(0.0, _POLL_JITTER_SECONDS)
 
 
 def _parse_view_payload(*, payload: str, pr_url: str) -> Result[dict[str, object], ReleaseError]:
@@ -51,6 +61,8 @@ def wait_until_mergeable(
     repo_label: str,
 ) -> Result[None, ReleaseError]:
     deadline = time.monotonic() + _MERGEABLE_WAIT_SECONDS
+    attempt = 0
+    last_seen: tuple[object, ...] | None = None
     while time.monotonic() < deadline:
         view = run_gh_process(
             [
@@ -94,7 +106,10 @@ def wait_until_mergeable(
             )
         if isinstance(merge_state, str) and merge_state == "CLEAN":
             return Ok(None)
-        time.sleep(_POLL_SECONDS)
+        seen = (state, merge_state)
+        attempt = 0 if seen != last_seen else attempt + 1
+        last_seen = seen
+        time.sleep(_poll_delay(attempt))
 
     return Err(
         ReleaseError(
@@ -113,6 +128,8 @@ def wait_until_merged(
     repo_label: str,
 ) -> Result[None, ReleaseError]:
     deadline = time.monotonic() + _MERGE_WAIT_SECONDS
+    attempt = 0
+    last_seen: tuple[object, ...] | None = None
     while time.monotonic() < deadline:
         view = run_gh_process(
             [
@@ -172,7 +189,10 @@ def wait_until_merged(
                     hint=pr_url,
                 )
             )
-        time.sleep(_POLL_SECONDS)
+        seen = (state, review_decision, auto_merge_request is not None)
+        attempt = 0 if seen != last_seen else attempt + 1
+        last_seen = seen
+        time.sleep(_poll_delay(attempt))
 
     return Err(
         ReleaseError(
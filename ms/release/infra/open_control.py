@@ -5,6 +5,7 @@ import re
 from pathlib import Path
 
 from ms.core.result import Err, Ok, Result
+from ms.git.repository import Repository
 from ms.platform.process import run as run_process
 from ms.release.domain.open_control_models import (
     OPEN_CONTROL_BOM_REPOS,
@@ -159,23 +160,6 @@ def _is_git_repo(path: Path) -> bool:
     return (path / ".git").exists() or (path / ".git").is_file()
 
 
-def _git_head_sha(*, repo_root: Path) -> str | None:
-    r = run_process(["git", "rev-parse", "HEAD"], cwd=repo_root, timeout=GIT_TIMEOUT_SECONDS)
-    if isinstance(r, Err):
-        return None
-    sha = r.value.strip()
-    if len(sha) != 40:
-        return None
-    return sha
-
-
-def _git_is_dirty(*, repo_root: Path) -> bool:
-    r = run_process(["git", "status", "--porcelain"], cwd=repo_root, timeout=GIT_TIMEOUT_SECONDS)
-    if isinstance(r, Err):
-        return False
-    return r.value.strip() != ""
-
-
 def collect_open_control_repos(*, workspace_root: Path) -> tuple[OpenControlRepoState, ...]:
     base = workspace_root / "open-control"
     states: list[OpenControlRepoState] = []
@@ -187,8 +171,10 @@ def collect_open_control_repos(*, workspace_root: Path) -> tuple[OpenControlRepo
                 OpenControlRepoState(repo=repo, path=path, exists=False, head_sha=None, dirty=False)
             )
             continue
-        head = _git_head_sha(repo_root=path)
-        dirty = _git_is_dirty(repo_root=path)
+        # One `git status --porcelain=v2 --branch` yields both HEAD and dirtiness.
+        status = Repository(path).status_with_head()
+        head = status.value.head_sha if isinstance(status, Ok) else None
+        dirty = isinstance(status, Ok) and not status.value.is_clean
         states.append(
             OpenControlRepoState(repo=repo, path=path, exists=True, head_sha=head, dirty=dirty)
         )
@@ -12,10 +12,19 @@ from ms.release.infra.github.timeouts import (
     GIT_TIMEOUT_SECONDS,
 )
 
+# Above this many paths the `git add` preview prints a count instead of the list.
+_ADD_PREVIEW_MAX_PATHS = 8
 
-def run_git_command(*, cmd: list[str], repo_root: Path, network: bool = False):
+
+def run_git_command(
+    *,
+    cmd: list[str],
+    repo_root: Path,
+    network: bool = False,
+    input: str | None = None,
+):
     timeout = GIT_NETWORK_TIMEOUT_SECONDS if network else GIT_TIMEOUT_SECONDS
-    return run_process(cmd, cwd=repo_root, timeout=timeout)
+    return run_process(cmd, cwd=repo_root, timeout=timeout, input=input)
 
 
 def ensure_repo_clone(
@@ -95,11 +104,12 @@ def checkout_main_and_pull(
     if dry_run:
         return Ok(None)
 
-    for cmd in (
-        ["git", "checkout", default_branch],
-        ["git", "pull", "--ff-only", "origin", default_branch],
-    ):
-        result = run_git_command(cmd=cmd, repo_root=repo_root, network=cmd[1] == "pull")
+    steps: tuple[tuple[list[str], bool], ...] = (
+        (["git", "checkout", default_branch], False),
+        (["git", "pull", "--ff-only", "origin", default_branch], True),
+    )
+    for cmd, network in steps:
+        result = run_git_command(cmd=cmd, repo_root=repo_root, network=network)
         if isinstance(result, Err):
             e = result.error
             return Err(
@@ -158,7 +168,10 @@ def commit_and_push(
     head_sha_invalid_error: str | None = None,
 ) -> Result[str | None, ReleaseError]:
     rels = [str(p.relative_to(repo_root)) for p in paths]
-    console.print(f"git add -A -- {' '.join(rels)}", Style.DIM)
+    if len(rels) > _ADD_PREVIEW_MAX_PATHS:
+        console.print(f"git add -A -- ({len(rels)} paths)", Style.DIM)
+    else:
+        console.print(f"git add -A -- {' '.join(rels)}", Style.DIM)
     console.print(f"git commit -m {message}", Style.DIM)
     console.print(f"git push -u origin {branch}", Style.DIM)
 
@@ -167,7 +180,12 @@ def commit_and_push(
             return Ok("0" * 40)
         return Ok(None)
 
-    add = run_git_command(cmd=["git", "add", "-A", "--", *rels], repo_root=repo_root)
+    # Paths go through stdin (NUL-separated) so large drops never hit ARG_MAX.
+    add = run_git_command(
+        cmd=["git", "add", "-A", "--pathspec-from-file=-", "--pathspec-file-nul"],
+        repo_root=repo_root,
+        input="\0".join(rels),
+    )
     if isinstance(add, Err):
         e = add.error
         return Err(
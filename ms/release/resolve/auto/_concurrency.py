@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+# Upper bound on concurrent per-repo lookups in one auto resolve. Each worker
+# runs its repo's git/gh calls one after another, so this also bounds the
+# number of subprocesses hitting GitHub at once (secondary rate limits).
+MAX_LOOKUP_WORKERS = 8
+
+
+def lookup_workers(count: int, *, limit: int = MAX_LOOKUP_WORKERS) -> int:
+    """Pool size for `count` independent per-repo lookups."""
+    return max(1, min(count, limit))
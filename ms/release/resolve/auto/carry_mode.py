@@ -38,6 +38,7 @@ def _find_latest_green_sha(
     if workflow is None:
         return Ok(None)
 
+    # Runs inside the smart resolver's per-repo pool; one GitHub query at a time.
     commits = list_recent_commits(
         workspace_root=workspace_root,
         repo=repo.slug,
@@ -63,6 +64,44 @@ def _find_latest_green_sha(
     return Ok(None)
 
 
+def _find_bump_suggestion(
+    *,
+    workspace_root: Path,
+    repo: ReleaseRepo,
+    selected_repo: ReleaseRepo,
+    diagnostics: RepoReadiness | None,
+    carried_sha: str,
+) -> AutoSuggestion | None:
+    latest_result = _find_latest_green_sha(
+        workspace_root=workspace_root,
+        repo=selected_repo,
+        limit_commits=30,
+        limit_runs=200,
+    )
+    if isinstance(latest_result, Err):
+        return None
+    latest = latest_result.value
+    if latest is None or latest == carried_sha:
+        return None
+
+    compared = compare_commits(
+        workspace_root=workspace_root,
+        repo=repo.slug,
+        base=carried_sha,
+        head=latest,
+    )
+    if isinstance(compared, Err) or compared.value.status != "ahead":
+        return None
+    return AutoSuggestion(
+        repo=selected_repo,
+        from_sha=carried_sha,
+        to_sha=latest,
+        kind="bump",
+        reason="newer green commit available",
+        applyable=(diagnostics is not None and is_applyable_locally(diagnostics)),
+    )
+
+
 def _collect_carry_mode_suggestions(
     *,
     workspace_root: Path,
@@ -76,32 +115,17 @@ def _collect_carry_mode_suggestions(
 
     suggestions: list[AutoSuggestion] = []
 
-    latest_result = _find_latest_green_sha(
-        workspace_root=workspace_root,
-        repo=selected_repo,
-        limit_commits=30,
-        limit_runs=200,
-    )
-    if isinstance(latest_result, Ok):
-        latest = latest_result.value
-        if latest is not None and latest != carried_sha:
-            compared = compare_commits(
-                workspace_root=workspace_root,
-                repo=repo.slug,
-                base=carried_sha,
-                head=latest,
-            )
-            if isinstance(compared, Ok) and compared.value.status == "ahead":
-                suggestions.append(
-                    AutoSuggestion(
-                        repo=selected_repo,
-                        from_sha=carried_sha,
-                        to_sha=latest,
-                        kind="bump",
-                        reason="newer green commit available",
-                        applyable=(diagnostics is not None and is_applyable_locally(diagnostics)),
-                    )
-                )
+    # A carried pin that is still the branch head cannot have a newer green commit.
+    if diagnostics is None or diagnostics.remote_head_sha != carried_sha:
+        bump = _find_bump_suggestion(
+            workspace_root=workspace_root,
+            repo=repo,
+            selected_repo=selected_repo,
+            diagnostics=diagnostics,
+            carried_sha=carried_sha,
+        )
+        if bump is not None:
+            suggestions.append(bump)
 
     if diagnostics is not None and not is_applyable_locally(diagnostics):
         suggestions.append(
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ms.core.result import Err, Ok, Result
 from ms.git.repository import GitError, Repository
-from ms.platform.process import run as run_process
 from ms.release.domain import config
 from ms.release.domain.diagnostics import RepoReadiness
 from ms.release.domain.models import ReleaseRepo
 from ms.release.errors import ReleaseError
-from ms.release.infra.github.ci import fetch_green_head_shas
+from ms.release.infra.github.ci import CiStatus, fetch_green_head_shas
 from ms.release.infra.github.client import get_ref_head_sha
-from ms.release.infra.github.timeouts import GIT_TIMEOUT_SECONDS
+
+from ._concurrency import MAX_LOOKUP_WORKERS, lookup_workers
 
 
 def local_issue_reason(readiness: RepoReadiness) -> str:
@@ -101,19 +102,12 @@ def build_dist_blocker(
     )
 
 
-def _git_head_sha(*, repo_root: Path) -> str | None:
-    result = run_process(["git", "rev-parse", "HEAD"], cwd=repo_root, timeout=GIT_TIMEOUT_SECONDS)
-    if isinstance(result, Err):
-        return None
-    sha = result.value.strip()
-    return sha if len(sha) == 40 else None
-
-
 def probe_release_readiness(
     *,
     workspace_root: Path,
     repo: ReleaseRepo,
     ref: str,
+    overlap_lookups: bool = True,
 ) -> Result[RepoReadiness, ReleaseError]:
     repo_path = local_repo_path(workspace_root=workspace_root, repo=repo)
     local_repo = Repository(repo_path)
@@ -132,7 +126,36 @@ def probe_release_readiness(
             )
         )
 
-    status_result = local_repo.status()
+    def lookup_remote_head() -> Result[str, ReleaseError]:
+        return get_ref_head_sha(workspace_root=workspace_root, repo=repo.slug, ref=ref)
+
+    def lookup_green_heads() -> Result[CiStatus, ReleaseError] | None:
+        workflow = repo.required_ci_workflow_file
+        if workflow is None:
+            return None
+        return fetch_green_head_shas(
+            workspace_root=workspace_root,
+            repo=repo.slug,
+            workflow_file=workflow,
+            branch=ref,
+            limit=30,
+        )
+
+    if overlap_lookups:
+        # The local git probe and the GitHub lookups are independent; overlap them.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            status_future = executor.submit(local_repo.status_with_head)
+            remote_head_future = executor.submit(lookup_remote_head)
+            green_future = executor.submit(lookup_green_heads)
+            status_result = status_future.result()
+            remote_head_result = remote_head_future.result()
+            green_result = green_future.result()
+    else:
+        # Already running under a per-repo pool; keep one subprocess per worker.
+        status_result = local_repo.status_with_head()
+        remote_head_result = lookup_remote_head()
+        green_result = lookup_green_heads()
+
     if isinstance(status_result, Err):
         error: GitError = status_result.error
         return Ok(
@@ -149,9 +172,7 @@ def probe_release_readiness(
             )
         )
 
-    local_head = _git_head_sha(repo_root=repo_path)
-
-    remote_head_result = get_ref_head_sha(workspace_root=workspace_root, repo=repo.slug, ref=ref)
+    local_head = status_result.value.head_sha
     if isinstance(remote_head_result, Err):
         return Ok(
             RepoReadiness(
@@ -170,14 +191,7 @@ def probe_release_readiness(
     remote_head = remote_head_result.value
 
     head_green: bool | None = None
-    if repo.required_ci_workflow_file is not None:
-        green_result = fetch_green_head_shas(
-            workspace_root=workspace_root,
-            repo=repo.slug,
-            workflow_file=repo.required_ci_workflow_file,
-            branch=ref,
-            limit=30,
-        )
+    if green_result is not None:
         if isinstance(green_result, Err):
             return Ok(
                 RepoReadiness(
@@ -214,11 +228,23 @@ def probe_repo_diagnostics(
     workspace_root: Path,
     repos: tuple[ReleaseRepo, ...],
     ref_overrides: dict[str, str],
+    max_workers: int = MAX_LOOKUP_WORKERS,
 ) -> dict[str, RepoReadiness]:
     diagnostics: dict[str, RepoReadiness] = {}
-    for repo in repos:
-        ref = resolve_repo_ref(repo=repo, ref_overrides=ref_overrides)
-        readiness = probe_release_readiness(workspace_root=workspace_root, repo=repo, ref=ref)
-        if isinstance(readiness, Ok):
-            diagnostics[repo.id] = readiness.value
+    refs = [resolve_repo_ref(repo=repo, ref_overrides=ref_overrides) for repo in repos]
+    with ThreadPoolExecutor(max_workers=lookup_workers(len(repos), limit=max_workers)) as executor:
+        futures = [
+            executor.submit(
+                probe_release_readiness,
+                workspace_root=workspace_root,
+                repo=repo,
+                ref=ref,
+                overlap_lookups=False,
+            )
+            for repo, ref in zip(repos, refs, strict=True)
+        ]
+        for repo, future in zip(repos, futures, strict=True):
+            readiness = future.result()
+            if isinstance(readiness, Ok):
+                diagnostics[repo.id] = readiness.value
     return diagnostics
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ms.core.result import Err, Ok, Result
 from ms.release.domain.diagnostics import AutoSuggestion
 from ms.release.domain.models import PinnedRepo, ReleaseChannel, ReleaseRepo
 
+from ._concurrency import MAX_LOOKUP_WORKERS, lookup_workers
 from .carry_mode import load_previous_channel_pins, resolve_carry_mode_pin
 from .diagnostics import (
     RepoReadiness,
@@ -33,17 +35,24 @@ def resolve_pinned_auto_smart(
         required_ci_workflow_file=None,
     )
 
-    diagnostics = probe_repo_diagnostics(
-        workspace_root=workspace_root,
-        repos=repos,
-        ref_overrides=ref_overrides,
-    )
+    # The previous release's pins come from the distribution repo and do not depend
+    # on the local probes; fetch them while the repos are being probed. That lookup
+    # takes one slot of the shared bound, so the probes get the rest.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        previous_pins_future = executor.submit(
+            load_previous_channel_pins,
+            workspace_root=workspace_root,
+            channel=channel,
+            dist_repo=dist_repo,
+        )
+        diagnostics = probe_repo_diagnostics(
+            workspace_root=workspace_root,
+            repos=repos,
+            ref_overrides=ref_overrides,
+            max_workers=MAX_LOOKUP_WORKERS - 1,
+        )
+        previous_pins = previous_pins_future.result()
 
-    previous_pins = load_previous_channel_pins(
-        workspace_root=workspace_root,
-        channel=channel,
-        dist_repo=dist_repo,
-    )
     if isinstance(previous_pins, Err):
         return Err(
             (
@@ -55,53 +64,75 @@ def resolve_pinned_auto_smart(
             )
         )
 
+    # Each repo's pin decision is independent (carry mode queries GitHub); resolve
+    # them concurrently and fold the results back in config order.
+    with ThreadPoolExecutor(max_workers=lookup_workers(len(repos))) as executor:
+        futures = [
+            executor.submit(
+                _resolve_repo_pin,
+                workspace_root=workspace_root,
+                repo=repo,
+                ref_overrides=ref_overrides,
+                head_repo_ids=head_repo_ids,
+                diagnostics=diagnostics.get(repo.id),
+                prev_pins=previous_pins.value,
+            )
+            for repo in repos
+        ]
+        results = [future.result() for future in futures]
+
     pinned: list[PinnedRepo] = []
     suggestions: list[AutoSuggestion] = []
     blockers: list[RepoReadiness] = []
+    for result in results:
+        if isinstance(result, Err):
+            blockers.append(result.error)
+            continue
+        pin, repo_suggestions = result.value
+        pinned.append(pin)
+        suggestions.extend(repo_suggestions)
 
-    for repo in repos:
-        ref = resolve_repo_ref(repo=repo, ref_overrides=ref_overrides)
-        selected_repo = repo_with_ref(repo=repo, ref=ref)
-        diag = diagnostics.get(repo.id)
+    if blockers:
+        return Err(tuple(blockers))
 
-        if is_head_mode_repo(
-            repo=repo,
-            ref=ref,
-            ref_overrides=ref_overrides,
-            head_repo_ids=head_repo_ids,
-        ):
-            head_pin = resolve_head_mode_pin(
-                workspace_root=workspace_root,
-                repo=repo,
-                ref=ref,
-                selected_repo=selected_repo,
-                diagnostics=diag,
-            )
-            if isinstance(head_pin, Err):
-                blockers.append(head_pin.error)
-                continue
-            pinned.append(head_pin.value)
-            continue
+    # `results` follows `repos`, so pins and suggestions keep config order.
+    return Ok((tuple(pinned), tuple(suggestions)))
 
-        carry_pin = resolve_carry_mode_pin(
+
+def _resolve_repo_pin(
+    *,
+    workspace_root: Path,
+    repo: ReleaseRepo,
+    ref_overrides: dict[str, str],
+    head_repo_ids: frozenset[str],
+    diagnostics: RepoReadiness | None,
+    prev_pins: dict[str, tuple[str, str]],
+) -> Result[tuple[PinnedRepo, tuple[AutoSuggestion, ...]], RepoReadiness]:
+    ref = resolve_repo_ref(repo=repo, ref_overrides=ref_overrides)
+    selected_repo = repo_with_ref(repo=repo, ref=ref)
+
+    if is_head_mode_repo(
+        repo=repo,
+        ref=ref,
+        ref_overrides=ref_overrides,
+        head_repo_ids=head_repo_ids,
+    ):
+        head_pin = resolve_head_mode_pin(
             workspace_root=workspace_root,
             repo=repo,
             ref=ref,
             selected_repo=selected_repo,
-            diagnostics=diag,
-            prev_pins=previous_pins.value,
+            diagnostics=diagnostics,
         )
-        if isinstance(carry_pin, Err):
-            blockers.append(carry_pin.error)
-            continue
+        if isinstance(head_pin, Err):
+            return head_pin
+        return Ok((head_pin.value, ()))
 
-        selected, carry_suggestions = carry_pin.value
-        pinned.append(selected)
-        suggestions.extend(carry_suggestions)
-
-    if blockers:
-        return Err(tuple(blockers))
-
-    by_id = {entry.repo.id: entry for entry in pinned}
-    ordered = tuple(by_id[repo.id] for repo in repos if repo.id in by_id)
-    return Ok((ordered, tuple(suggestions)))
+    return resolve_carry_mode_pin(
+        workspace_root=workspace_root,
+        repo=repo,
+        ref=ref,
+        selected_repo=selected_repo,
+        diagnostics=diagnostics,
+        prev_pins=prev_pins,
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from ms.core.result import Err, Ok, Result
 from ms.release.domain.models import PinnedRepo, ReleaseRepo
 
+from ._concurrency import lookup_workers
 from .diagnostics import RepoReadiness, local_repo_path, probe_release_readiness, resolve_repo_ref
 
 
@@ -17,9 +19,22 @@ def resolve_pinned_auto_strict(
     checked: list[RepoReadiness] = []
     pinned: list[PinnedRepo] = []
 
-    for repo in repos:
-        ref = resolve_repo_ref(repo=repo, ref_overrides=ref_overrides)
-        readiness = probe_release_readiness(workspace_root=workspace_root, repo=repo, ref=ref)
+    refs = [resolve_repo_ref(repo=repo, ref_overrides=ref_overrides) for repo in repos]
+    # Probes are independent and I/O-bound; run them concurrently, consume in order.
+    with ThreadPoolExecutor(max_workers=lookup_workers(len(repos))) as executor:
+        futures = [
+            executor.submit(
+                probe_release_readiness,
+                workspace_root=workspace_root,
+                repo=repo,
+                ref=ref,
+                overlap_lookups=False,
+            )
+            for repo, ref in zip(repos, refs, strict=True)
+        ]
+        results = [future.result() for future in futures]
+
+    for repo, ref, readiness in zip(repos, refs, results, strict=True):
         if isinstance(readiness, Err):
             checked.append(
                 RepoReadiness(
@@ -43,6 +58,5 @@ def resolve_pinned_auto_strict(
     if blockers:
         return Err(blockers)
 
-    by_id = {entry.repo.id: entry for entry in pinned}
-    ordered = tuple(by_id[repo.id] for repo in repos if repo.id in by_id)
-    return Ok(ordered)
+    # Probe results are consumed in input order, so pins already follow `repos`.
+    return Ok(tuple(pinned))
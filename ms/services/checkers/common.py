@@ -3,6 +3,7 @@
 
 This module provides shared functionality used by all checkers:
 - CommandRunner protocol for subprocess abstraction
+- ProbeCache for memoizing version probes
 - Hints loading and lookup
 - Common helper functions
 """
@@ -11,8 +12,10 @@ from __future__ import annotations
 
 import re
 import subprocess
+import threading
 import tomllib
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Protocol
 
@@ -57,6 +60,51 @@ class DefaultCommandRunner:
         )
 
 
+type _ProbeKey = tuple[tuple[str, ...], Path | None]
+
+
+class ProbeCache:
+    """Memoize successful probe commands for the lifetime of one checker.
+
+    Entries are keyed by (args, cwd). Concurrent callers for the same key wait
+    for the in-flight call instead of spawning a duplicate process. Only
+    successful results (returncode 0) are kept, so a failed probe is retried.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[_ProbeKey, subprocess.CompletedProcess[str]] = {}
+        self._inflight: dict[_ProbeKey, threading.Lock] = {}
+
+    def run(
+        self, runner: CommandRunner, args: list[str], *, cwd: Path | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        """Run a probe through `runner`, reusing a cached result if any."""
+        key: _ProbeKey = (tuple(args), cwd)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+            key_lock = self._inflight.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                cached = self._entries.get(key)
+            if cached is not None:
+                return cached
+
+            result: subprocess.CompletedProcess[str] | None = None
+            try:
+                result = runner.run(args, cwd=cwd)
+                return result
+            finally:
+                with self._lock:
+                    if result is not None and result.returncode == 0:
+                        self._entries[key] = result
+                    if self._inflight.get(key) is key_lock:
+                        del self._inflight[key]
+
+
 def _empty_hint_dict() -> dict[str, dict[str, str]]:
     """Factory for empty hint dictionaries."""
     return {}
@@ -124,12 +172,19 @@ def load_hints(path: Path | None = None) -> Hints:
         # -> ms/services -> ms -> ms/data
         path = Path(__file__).parent.parent.parent / "data" / "hints.toml"
 
-    if not path.exists():
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
         return Hints.empty()
+    return _load_hints_cached(str(path), mtime_ns)
+
 
+@lru_cache(maxsize=16)
+def _load_hints_cached(path: str, mtime_ns: int) -> Hints:
+    """Parse a hints file once per (path, mtime) version."""
+    del mtime_ns  # cache key only
     try:
-        content = path.read_text(encoding="utf-8")
-        data = tomllib.loads(content)
+        data = tomllib.loads(Path(path).read_text(encoding="utf-8"))
 
         return Hints(
             tools=_extract_section(data, "tools"),
@@ -250,6 +305,7 @@ if True:  # TYPE_CHECKING workaround for runtime imports
     __all__ = [
         "CommandRunner",
         "DefaultCommandRunner",
+        "ProbeCache",
         "Hints",
         "load_hints",
         "get_platform_key",
@@ -9,6 +9,8 @@ Validates that required build tools are installed:
 from __future__ import annotations
 
 import shutil
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING
@@ -21,17 +23,60 @@ from ms.services.checkers.common import (
     CommandRunner,
     DefaultCommandRunner,
     Hints,
+    ProbeCache,
     first_line,
     format_version_triplet,
     get_platform_key,
     parse_version_triplet,
 )
+from ms.tools.definitions import BunTool, CMakeTool, JdkTool, MavenTool, NinjaTool
 
 if TYPE_CHECKING:
     from ms.platform.detection import LinuxDistro, Platform
     from ms.tools.base import Tool
 
 
+# Upper bound on concurrent version probes in check_all().
+_CHECK_WORKERS = 8
+
+
+# Console scripts installed by `uv sync --extra dev`; a venv without them was
+# never fully synced (bare `uv venv`, interrupted sync, or sync without dev).
+_DEV_SCRIPTS = ("pytest", "pyright")
+
+
+def _venv_newer_than_lock(workspace_root: Path, platform: Platform) -> bool:
+    """Return True when .venv was synced with dev extras after the last lock change.
+
+    Inconclusive cases (any file missing or unreadable) return False so the
+    caller falls back to `uv sync --check`.
+    """
+    venv_dir = workspace_root / ".venv"
+    if platform.is_windows:
+        scripts = [venv_dir / "Scripts" / f"{name}.exe" for name in _DEV_SCRIPTS]
+    else:
+        scripts = [venv_dir / "bin" / name for name in _DEV_SCRIPTS]
+    if not all(script.is_file() for script in scripts):
+        return False
+    try:
+        venv_mtime = (venv_dir / "pyvenv.cfg").stat().st_mtime
+        lock_mtime = (workspace_root / "uv.lock").stat().st_mtime
+        pyproject_mtime = (workspace_root / "pyproject.toml").stat().st_mtime
+    except OSError:
+        return False
+    return venv_mtime > max(lock_mtime, pyproject_mtime)
+
+
+def _empty_which_cache() -> dict[str, str | None]:
+    """Factory for the per-checker PATH lookup cache."""
+    return {}
+
+
+def _empty_bundled_cache() -> dict[str, Path | None]:
+    """Factory for the per-checker bundled binary cache."""
+    return {}
+
+
 @dataclass(frozen=True, slots=True)
 class ToolsChecker:
     """Check that build tools are installed.
@@ -49,37 +94,43 @@ class ToolsChecker:
     hints: Hints = field(default_factory=Hints.empty)
     distro: LinuxDistro | None = None
     runner: CommandRunner = field(default_factory=DefaultCommandRunner)
+    _which_cache: dict[str, str | None] = field(
+        default_factory=_empty_which_cache, init=False, repr=False, compare=False
+    )
+    _bundled_cache: dict[str, Path | None] = field(
+        default_factory=_empty_bundled_cache, init=False, repr=False, compare=False
+    )
+    _version_probes: ProbeCache = field(
+        default_factory=ProbeCache, init=False, repr=False, compare=False
+    )
 
     def check_all(self) -> list[CheckResult]:
-        """Run all tool checks."""
-        results: list[CheckResult] = []
-
-        # System tools (must be in PATH)
-        results.append(self.check_system_tool("git", ["--version"]))
-        results.append(self.check_system_tool("gh", ["--version"], required=False))
-        results.append(self.check_system_tool("uv", ["--version"]))
-        results.append(self.check_rustc(required=False))
-        results.append(self.check_cargo(required=False))
-        results.append(self.check_gh_auth())
-        results.append(self.check_python_deps())
-
-        # Bundled tools
-        from ms.tools.definitions import (
-            BunTool,
-            CMakeTool,
-            JdkTool,
-            MavenTool,
-            NinjaTool,
-        )
-
-        results.append(self.check_bundled_tool(CMakeTool(), ["--version"]))
-        results.append(self.check_bundled_tool(NinjaTool(), ["--version"]))
-        results.append(self.check_bundled_tool(BunTool(), ["--version"], required=False))
-        results.append(self.check_bundled_tool(JdkTool(), ["-version"]))
-        results.append(self.check_bundled_tool(MavenTool(), ["-version"]))
-        results.append(self.check_platformio_runtime())
-
-        return results
+        """Run all tool checks.
+
+        Each check is dominated by a version-probe subprocess, so checks run
+        concurrently; results keep the declaration order below.
+        """
+        checks: list[Callable[[], CheckResult]] = [
+            # System tools (must be in PATH)
+            lambda: self.check_system_tool("git", ["--version"]),
+            lambda: self.check_system_tool("gh", ["--version"], required=False),
+            lambda: self.check_system_tool("uv", ["--version"]),
+            lambda: self.check_rustc(required=False),
+            lambda: self.check_cargo(required=False),
+            self.check_gh_auth,
+            self.check_python_deps,
+            # Bundled tools
+            lambda: self.check_bundled_tool(CMakeTool(), ["--version"]),
+            lambda: self.check_bundled_tool(NinjaTool(), ["--version"]),
+            lambda: self.check_bundled_tool(BunTool(), ["--version"], required=False),
+            lambda: self.check_bundled_tool(JdkTool(), ["-version"]),
+            lambda: self.check_bundled_tool(MavenTool(), ["-version"]),
+            self.check_platformio_runtime,
+        ]
+
+        with ThreadPoolExecutor(max_workers=_CHECK_WORKERS) as executor:
+            futures = [executor.submit(check) for check in checks]
+            return [future.result() for future in futures]
 
     def check_platformio_runtime(self) -> CheckResult:
         runtime = resolve_platformio_runtime(self.tools_dir.parent)
@@ -108,7 +159,7 @@ class ToolsChecker:
         required: bool = True,
     ) -> CheckResult:
         """Check a system tool is available in PATH."""
-        path = shutil.which(name)
+        path = self._which(name)
         if not path:
             hint = self._get_tool_hint(name)
             if required:
@@ -130,14 +181,14 @@ class ToolsChecker:
         name = tool.spec.id
 
         # Check bundled location first
-        bin_path = tool.bin_path(self.tools_dir, self.platform)
-        if bin_path and bin_path.exists():
+        bin_path = self._bundled_bin(tool)
+        if bin_path is not None:
             version = self._get_version_from_path(bin_path, version_args)
             msg = version if version else "ok"
             return CheckResult.success(name, msg)
 
         # Check PATH fallback
-        system_path = shutil.which(name)
+        system_path = self._which(name)
         if system_path:
             version = self._get_version(name, version_args)
             msg = version if version else "ok"
@@ -150,7 +201,7 @@ class ToolsChecker:
 
     def check_rustc(self, *, required: bool = False) -> CheckResult:
         """Check rustc is installed and meets the minimum version."""
-        if not shutil.which("rustc"):
+        if not self._which("rustc"):
             hint = self._rust_hint()
             if required:
                 return CheckResult.error(
@@ -169,7 +220,7 @@ class ToolsChecker:
 
     def check_cargo(self, *, required: bool = False) -> CheckResult:
         """Check cargo is installed and meets the minimum version."""
-        if not shutil.which("cargo"):
+        if not self._which("cargo"):
             hint = self._rust_hint()
             if required:
                 return CheckResult.error(
@@ -218,7 +269,7 @@ class ToolsChecker:
 
     def check_gh_auth(self) -> CheckResult:
         """Check GitHub CLI authentication status."""
-        if not shutil.which("gh"):
+        if not self._which("gh"):
             return CheckResult.warning("gh auth", "gh not installed")
 
         try:
@@ -235,11 +286,14 @@ class ToolsChecker:
 
     def check_python_deps(self) -> CheckResult:
         """Check Python dependencies are synced."""
-        if not shutil.which("uv"):
+        if not self._which("uv"):
             return CheckResult.warning("python deps", "uv not installed")
 
+        workspace_root = self.tools_dir.parent
+        if _venv_newer_than_lock(workspace_root, self.platform):
+            return CheckResult.success("python deps", "synced (.venv)")
+
         try:
-            workspace_root = self.tools_dir.parent
             # Keep dev tooling (pytest/pyright) in sync too.
             result = self.runner.run(
                 ["uv", "sync", "--check", "--extra", "dev"], cwd=workspace_root
@@ -254,33 +308,40 @@ class ToolsChecker:
         except OSError:
             return CheckResult.warning("python deps", "check failed")
 
+    def _which(self, name: str) -> str | None:
+        """Resolve an executable in PATH, at most once per checker instance.
+
+        The cache lives on the instance (not the module) so that a fresh checker
+        sees tools installed since the previous check (e.g. after prereqs install).
+        """
+        if name not in self._which_cache:
+            self._which_cache[name] = shutil.which(name)
+        return self._which_cache[name]
+
+    def _bundled_bin(self, tool: Tool) -> Path | None:
+        """Return the bundled binary for `tool` if present, probing disk once per tool id."""
+        tool_id = tool.spec.id
+        if tool_id not in self._bundled_cache:
+            bin_path = tool.bin_path(self.tools_dir, self.platform)
+            found = bin_path is not None and bin_path.exists()
+            self._bundled_cache[tool_id] = bin_path if found else None
+        return self._bundled_cache[tool_id]
+
     def _get_version(self, name: str, version_args: list[str] | None) -> str:
         """Get version string by running command."""
         if not version_args:
             return ""
-        try:
-            result = self.runner.run([name, *version_args])
-            if result.returncode == 0:
-                return first_line(result.stdout + result.stderr)
-        except OSError:
-            pass
-        return ""
+        return self._get_version_from_args([name, *version_args])
 
     def _get_version_from_path(self, path: Path, version_args: list[str] | None) -> str:
         """Get version string by running specific binary."""
         if not version_args:
             return ""
-        try:
-            result = self.runner.run([str(path), *version_args])
-            if result.returncode == 0:
-                return first_line(result.stdout + result.stderr)
-        except OSError:
-            pass
-        return ""
+        return self._get_version_from_args([str(path), *version_args])
 
     def _get_version_from_args(self, args: list[str]) -> str:
         try:
-            result = self.runner.run(args)
+            result = self._version_probes.run(self.runner, args)
             if result.returncode == 0:
                 return first_line(result.stdout + result.stderr)
         except OSError:
@@ -294,12 +355,12 @@ class ToolsChecker:
 
         # Prefer `winget` for selected tools on Windows when available.
         if tool_id == "git" and platform_key == "windows":
-            if shutil.which("winget"):
+            if self._which("winget"):
                 return "winget install --id Git.Git -e"
             return hint or "Install Git for Windows: https://git-scm.com/"
 
         if tool_id == "uv" and platform_key == "windows":
-            if shutil.which("winget"):
+            if self._which("winget"):
                 return "winget install --id astral-sh.uv -e"
             return hint or "Install uv: https://docs.astral.sh/uv/getting-started/installation/"
 
@@ -12,7 +12,9 @@ Validates that the workspace has:
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -24,6 +26,24 @@ if TYPE_CHECKING:
     from ms.platform.detection import Platform
 
 
+@cache
+def _default_bitwig_candidates(platform: Platform, home: str) -> tuple[Path, ...]:
+    """Platform-specific default Bitwig Extensions locations (memoized per home)."""
+    from ms.platform.detection import Platform
+
+    home_dir = Path(home)
+    match platform:
+        case Platform.LINUX:
+            return (
+                home_dir / "Bitwig Studio" / "Extensions",
+                home_dir / ".BitwigStudio" / "Extensions",
+            )
+        case Platform.MACOS | Platform.WINDOWS:
+            return (home_dir / "Documents" / "Bitwig Studio" / "Extensions",)
+        case _:
+            return ()
+
+
 def _empty_bitwig_paths() -> dict[str, str]:
     """Factory for empty bitwig paths dict."""
     return {}
@@ -44,6 +64,26 @@ class WorkspaceChecker:
     platform: Platform
     config: Config | None = None
     bitwig_paths: dict[str, str] = field(default_factory=_empty_bitwig_paths)
+    _tools_dir: Path = field(init=False, repr=False, compare=False)
+    _bridge_dir: Path = field(init=False, repr=False, compare=False)
+    _extension_dir: Path = field(init=False, repr=False, compare=False)
+    _exe_suffix: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Resolve config-dependent paths once; the checker is immutable.
+        root = self.workspace.root
+        if self.config is not None:
+            tools_dir = root / self.config.paths.tools
+            bridge_dir = root / self.config.paths.bridge
+            extension_dir = root / self.config.paths.extension
+        else:
+            tools_dir = root / "tools"
+            bridge_dir = root / "open-control" / "bridge"
+            extension_dir = root / "midi-studio" / "plugin-bitwig" / "host"
+        object.__setattr__(self, "_tools_dir", tools_dir)
+        object.__setattr__(self, "_bridge_dir", bridge_dir)
+        object.__setattr__(self, "_extension_dir", extension_dir)
+        object.__setattr__(self, "_exe_suffix", ".exe" if self.platform.is_windows else "")
 
     def check_all(self) -> list[CheckResult]:
         """Run all workspace checks."""
@@ -60,7 +100,7 @@ class WorkspaceChecker:
     def check_open_control(self) -> CheckResult:
         """Check open-control/ repository exists."""
         path = self.workspace.root / "open-control"
-        if path.is_dir():
+        if os.path.isdir(path):
             return CheckResult.success("open-control", "ok")
         return CheckResult.error(
             "open-control",
@@ -71,7 +111,7 @@ class WorkspaceChecker:
     def check_midi_studio(self) -> CheckResult:
         """Check midi-studio/ repository exists."""
         path = self.workspace.root / "midi-studio"
-        if path.is_dir():
+        if os.path.isdir(path):
             return CheckResult.success("midi-studio", "ok")
         return CheckResult.error(
             "midi-studio",
@@ -82,7 +122,7 @@ class WorkspaceChecker:
     def check_config(self) -> CheckResult:
         """Check config.toml exists and is valid."""
         path = self.workspace.root / "config.toml"
-        if not path.exists():
+        if not os.path.exists(path):
             return CheckResult.warning(
                 "config.toml",
                 "missing (using defaults)",
@@ -94,9 +134,8 @@ class WorkspaceChecker:
 
     def check_emsdk(self) -> CheckResult:
         """Check emsdk/ directory exists."""
-        tools_dir = self._get_tools_dir()
-        emsdk_dir = tools_dir / "emsdk"
-        if (emsdk_dir / "emsdk.py").exists():
+        emsdk_dir = self._tools_dir / "emsdk"
+        if os.path.exists(emsdk_dir / "emsdk.py"):
             return CheckResult.success("emsdk", "ok")
         return CheckResult.error(
             "emsdk",
@@ -106,14 +145,13 @@ class WorkspaceChecker:
 
     def check_bridge(self) -> CheckResult:
         """Check oc-bridge binary is installed or built."""
-        bridge_dir = self._get_bridge_dir()
-        exe_name = self._exe_name("oc-bridge")
+        exe_name = f"oc-bridge{self._exe_suffix}"
         installed_bin = self.workspace.bin_dir / "bridge" / exe_name
-        if installed_bin.exists():
+        if os.path.exists(installed_bin):
             return CheckResult.success("oc-bridge", f"installed ({installed_bin})")
 
-        bridge_bin = bridge_dir / "target" / "release" / exe_name
-        if bridge_bin.exists():
+        bridge_bin = self._bridge_dir / "target" / "release" / exe_name
+        if os.path.exists(bridge_bin):
             return CheckResult.success("oc-bridge", f"built ({bridge_bin})")
         return CheckResult.error(
             "oc-bridge",
@@ -123,8 +161,7 @@ class WorkspaceChecker:
 
     def check_bitwig_host(self) -> CheckResult:
         """Check bitwig host directory exists with pom.xml."""
-        ext_dir = self._get_extension_dir()
-        if (ext_dir / "pom.xml").exists():
+        if os.path.exists(self._extension_dir / "pom.xml"):
             return CheckResult.success("bitwig host", "ok")
         return CheckResult.error(
             "bitwig host",
@@ -135,7 +172,7 @@ class WorkspaceChecker:
     def check_bitwig_extensions(self) -> CheckResult:
         """Check Bitwig Extensions directory exists for deployment."""
         candidates = self._get_bitwig_extensions_candidates()
-        resolved = next((p for p in candidates if p.exists()), None)
+        resolved = next((p for p in candidates if os.path.exists(p)), None)
         if resolved is not None:
             return CheckResult.success("bitwig extensions", str(resolved))
         if candidates:
@@ -145,50 +182,12 @@ class WorkspaceChecker:
             )
         return CheckResult.warning("bitwig extensions", "not configured")
 
-    def _get_tools_dir(self) -> Path:
-        """Get tools directory from config or default."""
-        if self.config is not None:
-            return self.workspace.root / self.config.paths.tools
-        return self.workspace.root / "tools"
-
-    def _get_bridge_dir(self) -> Path:
-        """Get bridge directory from config or default."""
-        if self.config is not None:
-            return self.workspace.root / self.config.paths.bridge
-        return self.workspace.root / "open-control" / "bridge"
-
-    def _get_extension_dir(self) -> Path:
-        """Get extension directory from config or default."""
-        if self.config is not None:
-            return self.workspace.root / self.config.paths.extension
-        return self.workspace.root / "midi-studio" / "plugin-bitwig" / "host"
-
-    def _get_bitwig_extensions_candidates(self) -> list[Path]:
+    def _get_bitwig_extensions_candidates(self) -> tuple[Path, ...]:
         """Get candidate paths for Bitwig Extensions directory."""
-        from ms.platform.detection import Platform
-
         # Check config for platform-specific path
         platform_key = str(self.platform)
-        if platform_key in self.bitwig_paths:
-            configured = self.bitwig_paths[platform_key]
-            if configured:
-                return [Path(configured).expanduser()]
-
-        # Platform-specific defaults
-        home = Path.home()
-        match self.platform:
-            case Platform.LINUX:
-                return [
-                    home / "Bitwig Studio" / "Extensions",
-                    home / ".BitwigStudio" / "Extensions",
-                ]
-            case Platform.MACOS | Platform.WINDOWS:
-                return [home / "Documents" / "Bitwig Studio" / "Extensions"]
-            case _:
-                return []
-
-    def _exe_name(self, name: str) -> str:
-        """Get executable name for current platform."""
-        if self.platform.is_windows:
-            return f"{name}.exe"
-        return name
+        configured = self.bitwig_paths.get(platform_key)
+        if configured:
+            return (Path(configured).expanduser(),)
+
+        return _default_bitwig_candidates(self.platform, str(Path.home()))
@@ -14,15 +14,32 @@ from __future__ import annotations
 
 import hashlib
 import json
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from ms.core.result import Err
+from ms.git.repository import head_stamp
 from ms.platform.detection import Arch, Platform, detect
+from ms.platform.files import atomic_write_text
 from ms.platform.process import run as run_process
 
+_HASH_WORKERS = 8
+
+# Below this size, file_digest's buffered reads are as fast as mapping the file.
+_MMAP_HASH_MIN_BYTES = 16 * 1024 * 1024
+
+# Fast DEFLATE: packaging throughput matters more than the last few percent of size.
+_ZIP_COMPRESSLEVEL = 1
+
+# Payloads that are already compressed gain nothing from DEFLATE; store them as-is.
+_PRECOMPRESSED_SUFFIXES = frozenset(
+    {".bwextension", ".jar", ".zip", ".gz", ".xz", ".zst", ".png", ".jpg", ".jpeg", ".webp"}
+)
+
 
 @dataclass(frozen=True, slots=True)
 class DistAsset:
@@ -45,12 +62,18 @@ def _platform_str(platform: Platform) -> str:
     )
 
 
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
+def _size_and_sha256(path: Path) -> tuple[int, str]:
+    """Return (size, sha256) from a single open; size comes from fstat on the fd.
+
+    Large files are hashed straight from a read-only mapping, which avoids
+    copying every chunk from the page cache into a Python buffer.
+    """
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
+        size = os.fstat(f.fileno()).st_size
+        if size < _MMAP_HASH_MIN_BYTES:
+            return size, hashlib.file_digest(f, "sha256").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return size, hashlib.sha256(mapped).hexdigest()
 
 
 def _zip_files(zip_path: Path, *, files: list[tuple[Path, str]]) -> None:
@@ -58,9 +81,18 @@ def _zip_files(zip_path: Path, *, files: list[tuple[Path, str]]) -> None:
     # Some CI environments ship tool files with mtime=0 (Unix epoch). The ZIP
     # format cannot represent timestamps before 1980, and Python defaults to
     # strict timestamp validation.
-    with ZipFile(zip_path, "w", compression=ZIP_DEFLATED, strict_timestamps=False) as zf:
+    with ZipFile(
+        zip_path,
+        "w",
+        compression=ZIP_DEFLATED,
+        compresslevel=_ZIP_COMPRESSLEVEL,
+        strict_timestamps=False,
+    ) as zf:
         for src, arc in files:
-            zf.write(src, arcname=arc)
+            if src.suffix.lower() in _PRECOMPRESSED_SUFFIXES:
+                zf.write(src, arcname=arc, compress_type=ZIP_STORED)
+            else:
+                zf.write(src, arcname=arc)
 
 
 def _collect_dir(
@@ -70,21 +102,43 @@ def _collect_dir(
     exclude_names: set[str] | None = None,
     exclude_suffixes: tuple[str, ...] = (),
 ) -> list[tuple[Path, str]]:
-    if not base_dir.exists():
+    if not os.path.isdir(base_dir):
         return []
 
     exclude_names = exclude_names or set()
-    out: list[tuple[Path, str]] = []
-    for p in sorted(base_dir.rglob("*")):
-        if p.is_dir():
-            continue
-        if p.name in exclude_names:
-            continue
-        if exclude_suffixes and any(p.name.endswith(s) for s in exclude_suffixes):
+    # Work on plain strings while walking; Path objects are only built for the
+    # files that end up in the archive.
+    base_str = str(base_dir)
+    prefix_len = len(base_str) + len(os.sep)
+    # Path ordering case-folds on Windows; keep archive entry order identical.
+    fold_case = os.name == "nt"
+    found: list[tuple[tuple[str, ...], list[str], str]] = []
+    # Single scandir walk: DirEntry caches the d_type, so files and directories
+    # are told apart without an extra stat per entry.
+    pending = [base_str]
+    while pending:
+        try:
+            entries = os.scandir(pending.pop())
+        except OSError:
+            # Vanished or replaced mid-walk; rglob skipped these silently too.
             continue
-        rel = p.relative_to(base_dir).as_posix()
-        out.append((p, f"{arc_prefix}/{rel}"))
-    return out
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                if entry.is_dir():
+                    continue
+                if entry.name in exclude_names:
+                    continue
+                if exclude_suffixes and entry.name.endswith(exclude_suffixes):
+                    continue
+                parts = entry.path[prefix_len:].split(os.sep)
+                key = tuple(part.lower() for part in parts) if fold_case else tuple(parts)
+                found.append((key, parts, entry.path))
+
+    found.sort(key=lambda item: item[0])
+    return [(Path(full), f"{arc_prefix}/{'/'.join(parts)}") for _, parts, full in found]
 
 
 def package_platform(
@@ -150,7 +204,7 @@ def package_platform(
     )
     loader_bin = loader_dir / loader_name
 
-    if loader_bin.exists() and loader_bin.is_file():
+    if os.path.isfile(loader_bin):
         uploader_files.append((loader_bin, f"teensy/{loader_name}"))
 
     if uploader_files:
@@ -230,22 +284,21 @@ def generate_manifest(
 
     # Default source_hash is stable across platforms (ms sha + repo head shas)
     if source_hash is None:
-        h = hashlib.sha256()
-        h.update(ms_dev_env_sha.encode("ascii"))
+        buf = bytearray(ms_dev_env_sha.encode("ascii"))
         for r in repos:
             org = str(r.get("org", ""))
             name = str(r.get("name", ""))
             head = str(r.get("head_sha", ""))
-            h.update(b"\n")
-            h.update((org + "/" + name).encode("ascii", "ignore"))
-            h.update(b"@")
-            h.update(head.encode("ascii", "ignore"))
-        source_hash = h.hexdigest()
+            buf += f"\n{org}/{name}@{head}".encode("ascii", "ignore")
+        source_hash = hashlib.sha256(buf).hexdigest()
+
+    zips = sorted(dist_dir.glob("*.zip"))
+    # hashlib releases the GIL while digesting, so large bundles hash in parallel.
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as executor:
+        digests = list(executor.map(_size_and_sha256, zips))
 
     assets: list[DistAsset] = []
-    for p in sorted(dist_dir.glob("*.zip")):
-        size = p.stat().st_size
-        sha256 = _sha256_file(p)
+    for p, (size, sha256) in zip(zips, digests, strict=True):
         asset_id, kind, os_name, arch = _infer_asset_metadata(p.name)
         assets.append(
             DistAsset(
@@ -280,50 +333,77 @@ def generate_manifest(
         ],
     }
 
-    out_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
     return out_path
 
 
-def _infer_asset_metadata(filename: str) -> tuple[str, str, str | None, str | None]:
+type _AssetMetadata = tuple[str, str, str | None, str | None]
+
+# Platform-independent assets, matched by exact filename then by prefix.
+_EXACT_ASSETS: dict[str, _AssetMetadata] = {
+    "midi-studio-bitwig-extension.zip": ("bitwig_extension", "extension", None, None),
+    "midi-studio-firmware-teensy.zip": ("firmware_teensy", "firmware", None, None),
+}
+_PREFIX_ASSETS: tuple[tuple[str, _AssetMetadata], ...] = (
+    ("midi-studio-wasm-core", ("simulator_wasm_core", "simulator_wasm", None, None)),
+    ("midi-studio-wasm-bitwig", ("simulator_wasm_bitwig", "simulator_wasm", None, None)),
+)
+
+# Platform-scoped bundles: midi-studio-<os>-<arch>-<suffix>.zip -> (id prefix, kind)
+_PLATFORM_ASSET_KINDS: dict[str, tuple[str, str]] = {
+    "native": ("bundle_native", "bundle_native"),
+    "teensy-uploader": ("teensy_uploader", "uploader"),
+}
+
+
+def _infer_asset_metadata(filename: str) -> _AssetMetadata:
     """Infer (asset_id, kind, os, arch) from our deterministic filenames."""
-    if filename.startswith("midi-studio-wasm-core"):
-        return "simulator_wasm_core", "simulator_wasm", None, None
-    if filename.startswith("midi-studio-wasm-bitwig"):
-        return "simulator_wasm_bitwig", "simulator_wasm", None, None
-    if filename == "midi-studio-bitwig-extension.zip":
-        return "bitwig_extension", "extension", None, None
-    if filename == "midi-studio-firmware-teensy.zip":
-        return "firmware_teensy", "firmware", None, None
-
-    # Platform-scoped bundles
+    for prefix, metadata in _PREFIX_ASSETS:
+        if filename.startswith(prefix):
+            return metadata
+    exact = _EXACT_ASSETS.get(filename)
+    if exact is not None:
+        return exact
+
     if filename.startswith("midi-studio-"):
-        parts = filename.removesuffix(".zip").split("-")
-        # midi-studio-<os>-<arch>-<kind>
+        parts = filename.removesuffix(".zip").split("-", 4)
         if len(parts) >= 4:
-            os_name = parts[2]
-            arch = parts[3]
-            suffix = "-".join(parts[4:])
-            if suffix == "native":
-                return f"bundle_native_{os_name}_{arch}", "bundle_native", os_name, arch
-            if suffix == "teensy-uploader":
-                return f"teensy_uploader_{os_name}_{arch}", "uploader", os_name, arch
+            os_name, arch = parts[2], parts[3]
+            platform_kind = _PLATFORM_ASSET_KINDS.get(parts[4] if len(parts) == 5 else "")
+            if platform_kind is not None:
+                id_prefix, kind = platform_kind
+                return f"{id_prefix}_{os_name}_{arch}", kind, os_name, arch
 
     return f"asset_{filename}", "unknown", None, None
 
 
+_rev_cache: dict[tuple[str, int, int], str] = {}
+
+
 def _git_rev_parse(workspace_root: Path) -> str:
+    stamp = head_stamp(workspace_root)
+    key = (str(workspace_root.resolve()), *stamp) if stamp is not None else None
+    if key is not None and key in _rev_cache:
+        return _rev_cache[key]
+
     out = run_process(["git", "rev-parse", "HEAD"], cwd=workspace_root, timeout=30.0)
     if isinstance(out, Err):
         return "unknown"
-    return out.value.strip()
+    sha = out.value.strip()
+    if key is not None:
+        _rev_cache[key] = sha
+    return sha
 
 
 def _load_repos_lock(workspace_root: Path) -> list[dict[str, object]]:
     lock_path = workspace_root / ".ms" / "repos.lock.json"
     if lock_path.exists():
         try:
-            return json.loads(lock_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            # json.loads detects UTF-8 bytes itself, skipping a separate decode pass.
+            return json.loads(lock_path.read_bytes())
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
             pass
 
     # Fallback: best-effort, scan known clone roots.
@@ -332,7 +412,7 @@ def _load_repos_lock(workspace_root: Path) -> list[dict[str, object]]:
         if not base.exists():
             continue
         for child in sorted(base.iterdir()):
-            if not child.is_dir() or not (child / ".git").exists():
+            if not os.path.isdir(child) or not os.path.exists(child / ".git"):
                 continue
             sha = _git_rev_parse(child)
             repos.append(
@@ -342,10 +422,8 @@ def _load_repos_lock(workspace_root: Path) -> list[dict[str, object]]:
 
 
 def read_manifest(path: Path) -> dict[str, object]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return json.loads(path.read_bytes())
 
 
 def write_text_atomic(path: Path, content: str) -> None:
-    tmp = Path(f"{path}.tmp")
-    tmp.write_text(content, encoding="utf-8")
-    os.replace(tmp, path)
+    atomic_write_text(path, content, encoding="utf-8")
@@ -3,6 +3,7 @@ from __future__ import annotations
 import os
 import subprocess
 import sys
+from functools import cached_property
 from pathlib import Path
 
 from ms.core.result import Err, Ok, Result
@@ -13,8 +14,11 @@ from .models import HardwareAction, HardwareError, failure_kind
 
 
 class OCHardwareAdapterMixin(HardwareContextBase):
-    def _build_env(self) -> dict[str, str]:
-        return self._workspace.platformio_env_vars()
+    @cached_property
+    def _subprocess_env(self) -> dict[str, str]:
+        # Workspace paths are fixed for the lifetime of the service, so the
+        # env is merged once and every oc-* child sees the same dict.
+        return os.environ | self._workspace.platformio_env_vars()
 
     def _oc_cmd(self, module: str, *, env: str | None) -> list[str]:
         cmd = [sys.executable, "-m", f"ms.oc_cli.{module}"]
@@ -37,13 +41,8 @@ class OCHardwareAdapterMixin(HardwareContextBase):
         if dry_run:
             return Ok(None)
 
-        env_vars = self._build_env()
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=cwd,
-                env={**os.environ, **env_vars},
-            )
+            result = subprocess.run(cmd, cwd=cwd, env=self._subprocess_env)
         except OSError as error:
             return Err(HardwareError("script_missing", str(error)))
 
@@ -61,13 +60,8 @@ class OCHardwareAdapterMixin(HardwareContextBase):
         cmd = self._oc_cmd("oc_monitor", env=env)
         self._console.print(" ".join(cmd[:4]) + " ...", Style.DIM)
 
-        env_vars = self._build_env()
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=app_path,
-                env={**os.environ, **env_vars},
-            )
+            result = subprocess.run(cmd, cwd=app_path, env=self._subprocess_env)
             return result.returncode
         except KeyboardInterrupt:
             return 0
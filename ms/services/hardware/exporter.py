@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import shutil
 from pathlib import Path
 
@@ -19,7 +20,9 @@ class HardwareExporterMixin(HardwareContextBase):
     ) -> Result[None, HardwareError]:
         """Copy firmware.hex into bin/<app>/teensy/<env>/firmware.hex."""
         fw = app_root / ".pio" / "build" / env_name / "firmware.hex"
-        if not fw.exists():
+        try:
+            src_stat = os.stat(fw)
+        except OSError:
             return Err(
                 HardwareError(
                     "build_failed",
@@ -29,10 +32,23 @@ class HardwareExporterMixin(HardwareContextBase):
             )
 
         dst_dir = self._workspace.bin_dir / app_name / "teensy" / env_name
+        dst = dst_dir / "firmware.hex"
+        if _is_same_export(src_stat, dst):
+            return Ok(None)
+
         dst_dir.mkdir(parents=True, exist_ok=True)
         try:
-            shutil.copy2(fw, dst_dir / "firmware.hex")
+            shutil.copy2(fw, dst)
         except OSError as error:
             return Err(HardwareError("build_failed", f"failed to export firmware: {error}"))
 
         return Ok(None)
+
+
+def _is_same_export(src_stat: os.stat_result, dst: Path) -> bool:
+    """True when dst is an earlier copy2() of an unchanged source (size + mtime)."""
+    try:
+        dst_stat = os.stat(dst)
+    except OSError:
+        return False
+    return dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns
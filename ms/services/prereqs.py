@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Literal
 
@@ -35,6 +36,7 @@ class PrereqsService:
         self._config = config
         self._console = console
         self._confirm = confirm
+        self._tools_dir = workspace.root / (config.paths.tools if config else "tools")
 
     def ensure(
         self,
@@ -126,7 +128,7 @@ class PrereqsService:
         from ms.services.checkers import SystemChecker, ToolsChecker, load_hints
 
         hints = load_hints()
-        tools_dir = self._workspace.root / (self._config.paths.tools if self._config else "tools")
+        tools_dir = self._tools_dir
 
         system_checker = SystemChecker(
             platform=self._platform.platform,
@@ -134,25 +136,26 @@ class PrereqsService:
             tools_dir=tools_dir,
             hints=hints,
         )
-        issues: list[CheckResult] = [
-            r for r in system_checker.check_all() if r.status == CheckStatus.ERROR
-        ]
-
         tools_checker = ToolsChecker(
             platform=self._platform.platform,
             tools_dir=tools_dir,
             hints=hints,
             distro=self._platform.distro,
         )
+        tool_names = [
+            name for name, required in (("uv", require_uv), ("git", require_git)) if required
+        ]
 
-        if require_uv:
-            uv = tools_checker.check_system_tool("uv", ["--version"])
-            if uv.status != CheckStatus.OK:
-                issues.append(uv)
-
-        if require_git:
-            git = tools_checker.check_system_tool("git", ["--version"])
-            if git.status != CheckStatus.OK:
-                issues.append(git)
+        # The probes only spawn `--version`/pkg-config processes, so overlap them.
+        with ThreadPoolExecutor(max_workers=1 + len(tool_names)) as executor:
+            system = executor.submit(system_checker.check_all)
+            tools = [
+                executor.submit(tools_checker.check_system_tool, name, ["--version"])
+                for name in tool_names
+            ]
+            issues: list[CheckResult] = [
+                r for r in system.result() if r.status == CheckStatus.ERROR
+            ]
+            issues.extend(r for r in (f.result() for f in tools) if r.status != CheckStatus.OK)
 
         return issues
@@ -294,6 +294,65 @@ class TestRepository:
         assert error.command == "status"
         assert "not a git repository" in error.message
 
+    @patch("subprocess.run")
+    def test_status_with_head(self, mock_run: MagicMock, tmp_path: Path) -> None:
+        """Test status_with_head() parses porcelain v2 including HEAD."""
+        sha = "a" * 40
+        mock_run.return_value = make_completed_process(
+            stdout=(
+                f"# branch.oid {sha}\n"
+                "# branch.head main\n"
+                "# branch.upstream origin/main\n"
+                "# branch.ab +2 -1\n"
+                f"1 M. N... 100644 100644 100644 {sha} {sha} staged.py\n"
+                f"1 .M N... 100644 100644 100644 {sha} {sha} dir/with space.py\n"
+                f"2 R. N... 100644 100644 100644 {sha} {sha} R100 new.py\told.py\n"
+                "? new file.py\n"
+            )
+        )
+
+        repo = Repository(tmp_path)
+        result = repo.status_with_head()
+
+        assert isinstance(result, Ok)
+        status = result.unwrap()
+        assert status.head_sha == sha
+        assert (status.branch, status.upstream) == ("main", "origin/main")
+        assert (status.ahead, status.behind) == (2, 1)
+        assert [(e.xy, e.path) for e in status.entries] == [
+            ("M ", "staged.py"),
+            (" M", "dir/with space.py"),
+            ("R ", "old.py -> new.py"),
+            ("??", "new file.py"),
+        ]
+        assert mock_run.call_args.args[0][-3:] == ["status", "--porcelain=v2", "--branch"]
+
+    def test_status_with_head_matches_rev_parse(self, tmp_path: Path) -> None:
+        """Test status_with_head() against a real repository."""
+
+        def git(*args: str) -> str:
+            return subprocess.check_output(["git", *args], cwd=tmp_path, text=True).strip()
+
+        git("init", "-q", "-b", "main")
+        git("config", "user.email", "test@example.invalid")
+        git("config", "user.name", "Test")
+        repo = Repository(tmp_path)
+
+        initial = repo.status_with_head()
+        assert isinstance(initial, Ok)
+        assert initial.unwrap().head_sha is None
+
+        git("commit", "-q", "--allow-empty", "-m", "init")
+        (tmp_path / "untracked.txt").write_text("x")
+
+        result = repo.status_with_head()
+        assert isinstance(result, Ok)
+        status = result.unwrap()
+        assert status.head_sha == git("rev-parse", "HEAD")
+        assert status.branch == "main"
+        assert status.upstream is None
+        assert [(e.xy, e.path) for e in status.entries] == [("??", "untracked.txt")]
+
     @patch("subprocess.run")
     def test_is_clean_true(self, mock_run: MagicMock, tmp_path: Path) -> None:
         """Test is_clean() on clean repository."""
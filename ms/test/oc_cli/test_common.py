@@ -60,6 +60,17 @@ def test_detect_env_falls_back_to_default_envs(tmp_path: Path) -> None:
     assert detect_env(tmp_path, None) == "release"
 
 
+def test_detect_env_rereads_edited_platformio_ini(tmp_path: Path) -> None:
+    ini = tmp_path / "platformio.ini"
+    ini.write_text("default_envs = release\n", encoding="utf-8")
+    assert detect_env(tmp_path, None) == "release"
+    assert detect_env(tmp_path, None) == "release"
+
+    ini.write_text("default_envs = debug, release\n", encoding="utf-8")
+    os.utime(ini, ns=(1, 2_000_000_000))
+    assert detect_env(tmp_path, None) == "debug"
+
+
 def test_detect_env_falls_back_to_dev(tmp_path: Path) -> None:
     (tmp_path / "platformio.ini").write_text("[platformio]\n", encoding="utf-8")
     assert detect_env(tmp_path, None) == "dev"
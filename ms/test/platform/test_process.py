@@ -105,6 +105,16 @@ class TestRun:
         assert isinstance(result, Ok)
         assert "test_value" in result.value
 
+    def test_writes_input_to_stdin(self, tmp_path: Path) -> None:
+        result = run(
+            ["python", "-c", "import sys; print(sys.stdin.read().split('\\0'))"],
+            cwd=tmp_path,
+            input="a.txt\0b c.txt",
+        )
+
+        assert isinstance(result, Ok)
+        assert "['a.txt', 'b c.txt']" in result.value
+
     def test_timeout(self, tmp_path: Path) -> None:
         result = run(
             ["python", "-c", "import time; time.sleep(10)"],
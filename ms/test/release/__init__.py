@@ -0,0 +1 @@
+"""Release tooling tests."""
@@ -0,0 +1,14 @@
+from __future__ import annotations
+
+import threading
+
+
+def in_flight_barrier(parties: int) -> threading.Barrier:
+    """Return a barrier that fakes wait on to prove `parties` calls overlap.
+
+    Every fake sharing the barrier blocks until all of them are running at
+    once, so a serial implementation breaks the barrier after the timeout
+    instead of hanging the test run.
+    """
+
+    return threading.Barrier(parties, timeout=5)
@@ -104,3 +104,14 @@ def test_apply_version_updates_all_lockfiles(tmp_path: Path) -> None:
     assert package_lock["packages"][""]["version"] == "0.1.2-beta.1"
     cargo_lock_text = (app_root / "src-tauri" / "Cargo.lock").read_text(encoding="utf-8")
     assert 'version = "0.1.2-beta.1"' in cargo_lock_text
+
+
+def test_current_version_rejects_non_utf8_json(tmp_path: Path) -> None:
+    app_root = _seed_app_repo(tmp_path, version="0.1.2")
+    (app_root / "package.json").write_bytes(b'{"version": "\xff"}')
+
+    current = current_version(app_repo_root=app_root)
+
+    assert isinstance(current, Err)
+    assert current.error.kind == "invalid_input"
+    assert "package.json" in current.error.message
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from ms.core.result import Err, Ok, Result
+from ms.git.repository import GitStatus
+from ms.release.domain.diagnostics import AutoSuggestion, RepoReadiness
+from ms.release.domain.models import ReleaseRepo, RepoCommit
+from ms.release.errors import ReleaseError
+from ms.release.infra.github.ci import CiStatus
+from ms.release.infra.github.client import GhCompare
+from ms.release.resolve.auto.carry_mode import resolve_carry_mode_pin
+
+_REPO = ReleaseRepo(
+    id="core",
+    slug="petitechose-midi-studio/core",
+    ref="main",
+    required_ci_workflow_file=".github/workflows/ci.yml",
+)
+
+
+def test_resolve_carry_mode_pin_pins_latest_green_commit(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.carry_mode as carry_mode
+
+    def fake_list_recent_commits(
+        *, workspace_root: Path, repo: str, ref: str, limit: int
+    ) -> Result[list[RepoCommit], ReleaseError]:
+        return Ok(
+            [
+                RepoCommit(sha="b" * 40, message="red", date_utc=None),
+                RepoCommit(sha="a" * 40, message="green", date_utc=None),
+            ]
+        )
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        return Ok(CiStatus(green_head_shas=frozenset({"a" * 40})))
+
+    monkeypatch.setattr(carry_mode, "list_recent_commits", fake_list_recent_commits)
+    monkeypatch.setattr(carry_mode, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    result = resolve_carry_mode_pin(
+        workspace_root=Path("/unused"),
+        repo=_REPO,
+        ref="main",
+        selected_repo=_REPO,
+        diagnostics=None,
+        prev_pins={},
+    )
+
+    assert isinstance(result, Ok)
+    pinned, suggestions = result.value
+    assert pinned.sha == "a" * 40
+    assert suggestions == ()
+
+
+def test_resolve_carry_mode_pin_reports_commit_lookup_error_first(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.carry_mode as carry_mode
+
+    def fake_list_recent_commits(
+        *, workspace_root: Path, repo: str, ref: str, limit: int
+    ) -> Result[list[RepoCommit], ReleaseError]:
+        return Err(ReleaseError(kind="repo_failed", message="commits failed"))
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        return Err(ReleaseError(kind="repo_failed", message="runs failed"))
+
+    monkeypatch.setattr(carry_mode, "list_recent_commits", fake_list_recent_commits)
+    monkeypatch.setattr(carry_mode, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    result = resolve_carry_mode_pin(
+        workspace_root=Path("/unused"),
+        repo=_REPO,
+        ref="main",
+        selected_repo=_REPO,
+        diagnostics=None,
+        prev_pins={},
+    )
+
+    assert isinstance(result, Err)
+    assert result.error.error == "commits failed"
+
+
+def _readiness(repo: ReleaseRepo, *, remote_head_sha: str) -> RepoReadiness:
+    return RepoReadiness(
+        repo=repo,
+        ref=repo.ref,
+        local_path=Path("/unused") / repo.id,
+        local_exists=True,
+        status=GitStatus(branch="main", upstream="origin/main"),
+        local_head_sha=remote_head_sha,
+        remote_head_sha=remote_head_sha,
+        head_green=True,
+        error=None,
+    )
+
+
+def test_resolve_carry_mode_pin_skips_bump_lookup_when_pin_is_branch_head(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.carry_mode as carry_mode
+
+    loader = ReleaseRepo(
+        id="loader",
+        slug="open-control/loader",
+        ref="main",
+        required_ci_workflow_file=".github/workflows/ci.yml",
+    )
+    carried = "a" * 40
+    newer = "b" * 40
+    lookups: list[str] = []
+
+    def fake_is_ci_green_for_sha(
+        *, workspace_root: Path, repo: str, workflow: str, sha: str
+    ) -> Result[bool, ReleaseError]:
+        return Ok(True)
+
+    def fake_list_recent_commits(
+        *, workspace_root: Path, repo: str, ref: str, limit: int
+    ) -> Result[list[RepoCommit], ReleaseError]:
+        lookups.append("commits")
+        return Ok([RepoCommit(sha=newer, message="next", date_utc=None)])
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        lookups.append("runs")
+        return Ok(CiStatus(green_head_shas=frozenset({newer})))
+
+    def fake_compare_commits(
+        *, workspace_root: Path, repo: str, base: str, head: str
+    ) -> Result[GhCompare, ReleaseError]:
+        return Ok(GhCompare(status="ahead", ahead_by=1, behind_by=0))
+
+    monkeypatch.setattr(carry_mode, "is_ci_green_for_sha", fake_is_ci_green_for_sha)
+    monkeypatch.setattr(carry_mode, "list_recent_commits", fake_list_recent_commits)
+    monkeypatch.setattr(carry_mode, "fetch_green_head_shas", fake_fetch_green_head_shas)
+    monkeypatch.setattr(carry_mode, "compare_commits", fake_compare_commits)
+
+    def resolve(remote_head_sha: str) -> tuple[AutoSuggestion, ...]:
+        result = resolve_carry_mode_pin(
+            workspace_root=Path("/unused"),
+            repo=loader,
+            ref="main",
+            selected_repo=loader,
+            diagnostics=_readiness(loader, remote_head_sha=remote_head_sha),
+            prev_pins={"loader": (carried, "main")},
+        )
+        assert isinstance(result, Ok)
+        assert result.value[0].sha == carried
+        return result.value[1]
+
+    assert resolve(carried) == ()
+    assert lookups == []
+
+    suggestions = resolve(newer)
+    assert [(s.kind, s.to_sha) for s in suggestions] == [("bump", newer)]
+    assert sorted(lookups) == ["commits", "runs"]
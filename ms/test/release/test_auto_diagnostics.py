@@ -0,0 +1,216 @@
+from __future__ import annotations
+
+import subprocess
+import threading
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from ms.core.result import Err, Ok, Result
+from ms.release.domain.diagnostics import RepoReadiness
+from ms.release.domain.models import ReleaseRepo
+from ms.release.errors import ReleaseError
+from ms.release.infra.github.ci import CiStatus
+from ms.release.resolve.auto.diagnostics import (
+    probe_release_readiness,
+    probe_repo_diagnostics,
+)
+
+from ._concurrency import in_flight_barrier
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path, text=True).strip()
+
+
+def _local_repo(workspace_root: Path) -> str:
+    repo_root = workspace_root / "open-control" / "bridge"
+    repo_root.mkdir(parents=True)
+    _git(repo_root, "init", "-q", "-b", "main")
+    _git(repo_root, "config", "user.email", "test@example.invalid")
+    _git(repo_root, "config", "user.name", "Test")
+    _git(repo_root, "commit", "-q", "--allow-empty", "-m", "init")
+    return _git(repo_root, "rev-parse", "HEAD")
+
+
+_REPO = ReleaseRepo(
+    id="bridge",
+    slug="open-control/bridge",
+    ref="main",
+    required_ci_workflow_file=".github/workflows/ci.yml",
+)
+
+
+def test_probe_release_readiness_overlaps_github_lookups(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    import ms.release.resolve.auto.diagnostics as diagnostics
+
+    head = _local_repo(tmp_path)
+    barrier = in_flight_barrier(2)
+
+    def fake_get_ref_head_sha(
+        *, workspace_root: Path, repo: str, ref: str
+    ) -> Result[str, ReleaseError]:
+        barrier.wait()
+        return Ok(head)
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        barrier.wait()
+        return Ok(CiStatus(green_head_shas=frozenset({head})))
+
+    monkeypatch.setattr(diagnostics, "get_ref_head_sha", fake_get_ref_head_sha)
+    monkeypatch.setattr(diagnostics, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    result = probe_release_readiness(workspace_root=tmp_path, repo=_REPO, ref="main")
+
+    assert isinstance(result, Ok)
+    readiness = result.value
+    assert readiness.error is None
+    assert readiness.local_head_sha == head
+    assert readiness.remote_head_sha == head
+    assert readiness.head_green is True
+    assert readiness.status is not None and readiness.status.branch == "main"
+
+
+def test_probe_release_readiness_runs_lookups_inline_without_overlap(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    import ms.release.resolve.auto.diagnostics as diagnostics
+
+    head = _local_repo(tmp_path)
+    lookup_threads: list[int] = []
+
+    def fake_get_ref_head_sha(
+        *, workspace_root: Path, repo: str, ref: str
+    ) -> Result[str, ReleaseError]:
+        lookup_threads.append(threading.get_ident())
+        return Ok(head)
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        lookup_threads.append(threading.get_ident())
+        return Ok(CiStatus(green_head_shas=frozenset({head})))
+
+    monkeypatch.setattr(diagnostics, "get_ref_head_sha", fake_get_ref_head_sha)
+    monkeypatch.setattr(diagnostics, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    result = probe_release_readiness(
+        workspace_root=tmp_path, repo=_REPO, ref="main", overlap_lookups=False
+    )
+
+    assert isinstance(result, Ok)
+    assert result.value.error is None and result.value.head_green is True
+    assert lookup_threads == [threading.get_ident()] * 2
+
+
+def test_probe_release_readiness_reports_remote_error_before_ci(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    import ms.release.resolve.auto.diagnostics as diagnostics
+
+    head = _local_repo(tmp_path)
+
+    def fake_get_ref_head_sha(
+        *, workspace_root: Path, repo: str, ref: str
+    ) -> Result[str, ReleaseError]:
+        return Err(ReleaseError(kind="repo_failed", message="remote lookup failed"))
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        return Err(ReleaseError(kind="repo_failed", message="ci lookup failed"))
+
+    monkeypatch.setattr(diagnostics, "get_ref_head_sha", fake_get_ref_head_sha)
+    monkeypatch.setattr(diagnostics, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    result = probe_release_readiness(workspace_root=tmp_path, repo=_REPO, ref="main")
+
+    assert isinstance(result, Ok)
+    assert result.value.error == "remote lookup failed"
+    assert result.value.local_head_sha == head
+    assert result.value.remote_head_sha is None
+
+
+def test_probe_release_readiness_reprobes_worktree_on_every_call(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    import ms.release.resolve.auto.diagnostics as diagnostics
+
+    head = _local_repo(tmp_path)
+    repo_root = tmp_path / "open-control" / "bridge"
+    _git(tmp_path, "init", "-q", "--bare", str(tmp_path / "remote.git"))
+    _git(repo_root, "remote", "add", "origin", str(tmp_path / "remote.git"))
+    _git(repo_root, "push", "-q", "-u", "origin", "main")
+
+    def fake_get_ref_head_sha(
+        *, workspace_root: Path, repo: str, ref: str
+    ) -> Result[str, ReleaseError]:
+        return Ok(head)
+
+    def fake_fetch_green_head_shas(
+        *, workspace_root: Path, repo: str, workflow_file: str, branch: str, limit: int
+    ) -> Result[CiStatus, ReleaseError]:
+        return Ok(CiStatus(green_head_shas=frozenset({head})))
+
+    monkeypatch.setattr(diagnostics, "get_ref_head_sha", fake_get_ref_head_sha)
+    monkeypatch.setattr(diagnostics, "fetch_green_head_shas", fake_fetch_green_head_shas)
+
+    ready = probe_release_readiness(workspace_root=tmp_path, repo=_REPO, ref="main")
+    assert isinstance(ready, Ok) and ready.value.is_ready()
+
+    # An untracked file moves neither HEAD nor the index; it must still be seen.
+    (repo_root / "scratch.txt").write_text("x")
+    dirty = probe_release_readiness(workspace_root=tmp_path, repo=_REPO, ref="main")
+    assert isinstance(dirty, Ok)
+    assert not dirty.value.is_ready()
+    assert dirty.value.status is not None and not dirty.value.status.is_clean
+
+
+def test_probe_repo_diagnostics_probes_repos_concurrently(monkeypatch: MonkeyPatch) -> None:
+    import ms.release.resolve.auto.diagnostics as diagnostics
+
+    repos = tuple(
+        ReleaseRepo(
+            id=repo_id, slug=f"open-control/{repo_id}", ref="main", required_ci_workflow_file=None
+        )
+        for repo_id in ("framework", "bridge", "note")
+    )
+    barrier = in_flight_barrier(len(repos))
+    seen_refs: dict[str, str] = {}
+
+    def fake_probe(
+        *, workspace_root: Path, repo: ReleaseRepo, ref: str, overlap_lookups: bool
+    ) -> Result[RepoReadiness, ReleaseError]:
+        assert not overlap_lookups
+        barrier.wait()
+        seen_refs[repo.id] = ref
+        if repo.id == "note":
+            return Err(ReleaseError(kind="repo_failed", message="boom"))
+        return Ok(
+            RepoReadiness(
+                repo=repo,
+                ref=ref,
+                local_path=workspace_root / repo.id,
+                local_exists=False,
+                status=None,
+                local_head_sha=None,
+                remote_head_sha=None,
+                head_green=None,
+                error=None,
+            )
+        )
+
+    monkeypatch.setattr(diagnostics, "probe_release_readiness", fake_probe)
+
+    result = probe_repo_diagnostics(
+        workspace_root=Path("/unused"),
+        repos=repos,
+        ref_overrides={"bridge": "release"},
+    )
+
+    assert list(result) == ["framework", "bridge"]
+    assert seen_refs == {"framework": "main", "bridge": "release", "note": "main"}
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from ms.core.result import Err, Ok, Result
+from ms.release.domain.diagnostics import AutoSuggestion, RepoReadiness
+from ms.release.domain.models import PinnedRepo, ReleaseRepo
+from ms.release.resolve.auto.smart import resolve_pinned_auto_smart
+
+from ._concurrency import in_flight_barrier
+
+
+def _repo(repo_id: str) -> ReleaseRepo:
+    return ReleaseRepo(
+        id=repo_id,
+        slug=f"open-control/{repo_id}",
+        ref="main",
+        required_ci_workflow_file=".github/workflows/ci.yml",
+    )
+
+
+def _blocker(repo: ReleaseRepo, error: str) -> RepoReadiness:
+    return RepoReadiness(
+        repo=repo,
+        ref=repo.ref,
+        local_path=Path("/unused") / repo.id,
+        local_exists=False,
+        status=None,
+        local_head_sha=None,
+        remote_head_sha=None,
+        head_green=None,
+        error=error,
+    )
+
+
+def _patch_inputs(monkeypatch: MonkeyPatch) -> None:
+    import ms.release.resolve.auto.smart as smart
+
+    def fake_probe_repo_diagnostics(
+        *,
+        workspace_root: Path,
+        repos: tuple[ReleaseRepo, ...],
+        ref_overrides: dict[str, str],
+        max_workers: int,
+    ) -> dict[str, RepoReadiness]:
+        return {}
+
+    def fake_load_previous_channel_pins(
+        *, workspace_root: Path, channel: str, dist_repo: str
+    ) -> Result[dict[str, tuple[str, str]], str]:
+        return Ok({})
+
+    monkeypatch.setattr(smart, "probe_repo_diagnostics", fake_probe_repo_diagnostics)
+    monkeypatch.setattr(smart, "load_previous_channel_pins", fake_load_previous_channel_pins)
+
+
+def test_resolve_pinned_auto_smart_resolves_carry_repos_concurrently_in_order(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.smart as smart
+
+    repos = (_repo("framework"), _repo("bridge"), _repo("note"))
+    barrier = in_flight_barrier(len(repos))
+
+    def fake_resolve_carry_mode_pin(
+        *,
+        workspace_root: Path,
+        repo: ReleaseRepo,
+        ref: str,
+        selected_repo: ReleaseRepo,
+        diagnostics: RepoReadiness | None,
+        prev_pins: dict[str, tuple[str, str]],
+    ) -> Result[tuple[PinnedRepo, tuple[AutoSuggestion, ...]], RepoReadiness]:
+        barrier.wait()
+        sha = repo.id[0] * 40
+        suggestion = AutoSuggestion(
+            repo=selected_repo,
+            from_sha=sha,
+            to_sha=sha,
+            kind="local",
+            reason=repo.id,
+            applyable=False,
+        )
+        return Ok((PinnedRepo(repo=selected_repo, sha=sha), (suggestion,)))
+
+    _patch_inputs(monkeypatch)
+    monkeypatch.setattr(smart, "resolve_carry_mode_pin", fake_resolve_carry_mode_pin)
+
+    result = resolve_pinned_auto_smart(
+        workspace_root=Path("/unused"),
+        channel="beta",
+        dist_repo="petitechose-midi-studio/distribution",
+        repos=repos,
+        ref_overrides={},
+        head_repo_ids=frozenset(),
+    )
+
+    assert isinstance(result, Ok)
+    pinned, suggestions = result.value
+    assert [p.repo.id for p in pinned] == ["framework", "bridge", "note"]
+    assert [s.reason for s in suggestions] == ["framework", "bridge", "note"]
+
+
+def test_resolve_pinned_auto_smart_reports_blockers_in_repo_order(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.smart as smart
+
+    repos = (_repo("framework"), _repo("bridge"), _repo("note"))
+
+    def fake_resolve_carry_mode_pin(
+        *,
+        workspace_root: Path,
+        repo: ReleaseRepo,
+        ref: str,
+        selected_repo: ReleaseRepo,
+        diagnostics: RepoReadiness | None,
+        prev_pins: dict[str, tuple[str, str]],
+    ) -> Result[tuple[PinnedRepo, tuple[AutoSuggestion, ...]], RepoReadiness]:
+        if repo.id == "framework":
+            return Ok((PinnedRepo(repo=selected_repo, sha="f" * 40), ()))
+        return Err(_blocker(repo, f"{repo.id} blocked"))
+
+    _patch_inputs(monkeypatch)
+    monkeypatch.setattr(smart, "resolve_carry_mode_pin", fake_resolve_carry_mode_pin)
+
+    result = resolve_pinned_auto_smart(
+        workspace_root=Path("/unused"),
+        channel="beta",
+        dist_repo="petitechose-midi-studio/distribution",
+        repos=repos,
+        ref_overrides={},
+        head_repo_ids=frozenset(),
+    )
+
+    assert isinstance(result, Err)
+    assert [b.error for b in result.error] == ["bridge blocked", "note blocked"]
+
+
+def test_resolve_pinned_auto_smart_loads_previous_pins_while_probing(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.smart as smart
+
+    repos = (_repo("framework"),)
+    barrier = in_flight_barrier(2)
+
+    def fake_probe_repo_diagnostics(
+        *,
+        workspace_root: Path,
+        repos: tuple[ReleaseRepo, ...],
+        ref_overrides: dict[str, str],
+        max_workers: int,
+    ) -> dict[str, RepoReadiness]:
+        barrier.wait()
+        return {}
+
+    def fake_load_previous_channel_pins(
+        *, workspace_root: Path, channel: str, dist_repo: str
+    ) -> Result[dict[str, tuple[str, str]], str]:
+        barrier.wait()
+        return Err("no previous release")
+
+    monkeypatch.setattr(smart, "probe_repo_diagnostics", fake_probe_repo_diagnostics)
+    monkeypatch.setattr(smart, "load_previous_channel_pins", fake_load_previous_channel_pins)
+
+    result = resolve_pinned_auto_smart(
+        workspace_root=Path("/unused"),
+        channel="beta",
+        dist_repo="petitechose-midi-studio/distribution",
+        repos=repos,
+        ref_overrides={},
+        head_repo_ids=frozenset(),
+    )
+
+    assert isinstance(result, Err)
+    assert [(b.repo.id, b.error) for b in result.error] == [("distribution", "no previous release")]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pytest import MonkeyPatch
+
+from ms.core.result import Err, Ok, Result
+from ms.git.repository import GitStatus
+from ms.release.domain.diagnostics import RepoReadiness
+from ms.release.domain.models import ReleaseRepo
+from ms.release.errors import ReleaseError
+from ms.release.resolve.auto.strict import resolve_pinned_auto_strict
+
+from ._concurrency import in_flight_barrier
+
+
+def _repo(repo_id: str) -> ReleaseRepo:
+    return ReleaseRepo(
+        id=repo_id,
+        slug=f"open-control/{repo_id}",
+        ref="main",
+        required_ci_workflow_file=".github/workflows/ci.yml",
+    )
+
+
+def _ready(repo: ReleaseRepo, *, ref: str, sha: str) -> RepoReadiness:
+    return RepoReadiness(
+        repo=repo,
+        ref=ref,
+        local_path=Path("/unused") / repo.id,
+        local_exists=True,
+        status=GitStatus(branch="main", upstream="origin/main"),
+        local_head_sha=sha,
+        remote_head_sha=sha,
+        head_green=True,
+        error=None,
+    )
+
+
+def test_resolve_pinned_auto_strict_probes_concurrently_and_keeps_order(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.strict as strict
+
+    repos = (_repo("framework"), _repo("bridge"), _repo("note"))
+    shas = {"framework": "a" * 40, "bridge": "b" * 40, "note": "c" * 40}
+    barrier = in_flight_barrier(len(repos))
+
+    def fake_probe(
+        *, workspace_root: Path, repo: ReleaseRepo, ref: str, overlap_lookups: bool
+    ) -> Result[RepoReadiness, ReleaseError]:
+        assert not overlap_lookups  # the outer pool already bounds subprocesses
+        barrier.wait()
+        return Ok(_ready(repo, ref=ref, sha=shas[repo.id]))
+
+    monkeypatch.setattr(strict, "probe_release_readiness", fake_probe)
+
+    result = resolve_pinned_auto_strict(
+        workspace_root=Path("/unused"),
+        repos=repos,
+        ref_overrides={"bridge": "release"},
+    )
+
+    assert isinstance(result, Ok)
+    assert [(p.repo.id, p.sha) for p in result.value] == [
+        ("framework", "a" * 40),
+        ("bridge", "b" * 40),
+        ("note", "c" * 40),
+    ]
+
+
+def test_resolve_pinned_auto_strict_reports_blockers_in_repo_order(
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.resolve.auto.strict as strict
+
+    repos = (_repo("framework"), _repo("bridge"), _repo("note"))
+
+    def fake_probe(
+        *, workspace_root: Path, repo: ReleaseRepo, ref: str, overlap_lookups: bool
+    ) -> Result[RepoReadiness, ReleaseError]:
+        if repo.id == "bridge":
+            return Err(ReleaseError(kind="repo_failed", message="boom"))
+        return Ok(_ready(repo, ref=ref, sha="d" * 40))
+
+    monkeypatch.setattr(strict, "probe_release_readiness", fake_probe)
+
+    result = resolve_pinned_auto_strict(
+        workspace_root=Path("/unused"),
+        repos=repos,
+        ref_overrides={},
+    )
+
+    assert isinstance(result, Err)
+    assert [(b.repo.id, b.error) for b in result.error] == [("bridge", "boom")]
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from ms.core.result import Ok
+from ms.output.console import MockConsole
+from ms.release.infra.repos.git_ops import commit_and_push
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path, text=True).strip()
+
+
+def _init_repo_with_remote(tmp_path: Path) -> Path:
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "release/test")
+    _git(repo, "config", "user.email", "test@example.invalid")
+    _git(repo, "config", "user.name", "Test")
+    _git(repo, "remote", "add", "origin", str(remote))
+    return repo
+
+
+def test_commit_and_push_stages_only_given_paths(tmp_path: Path) -> None:
+    repo = _init_repo_with_remote(tmp_path)
+    paths = [repo / f"dir {i}" / "firmware.hex" for i in range(12)]
+    for p in paths:
+        p.parent.mkdir()
+        p.write_text("hex", encoding="utf-8")
+    (repo / "untracked.txt").write_text("x", encoding="utf-8")
+
+    console = MockConsole()
+    result = commit_and_push(
+        repo_root=repo,
+        branch="release/test",
+        paths=paths,
+        message="release",
+        console=console,
+        dry_run=False,
+        return_head_sha=True,
+    )
+
+    assert isinstance(result, Ok)
+    assert result.value == _git(repo, "rev-parse", "HEAD")
+    committed = _git(repo, "show", "--name-only", "--format=", "HEAD").splitlines()
+    assert sorted(committed) == sorted(f"dir {i}/firmware.hex" for i in range(12))
+    assert _git(repo, "status", "--porcelain") == "?? untracked.txt"
+    assert "git add -A -- (12 paths)" in console.text
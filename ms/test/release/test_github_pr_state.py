@@ -77,3 +77,41 @@ def test_wait_until_merged_stops_when_auto_merge_waits_for_review(
         "Approve the release PR with a different authorized identity, "
         "then rerun the release command. PR: https://example.invalid/pr/1"
     )
+
+
+def test_wait_until_mergeable_backs_off_and_resets_on_state_change(
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+) -> None:
+    import ms.release.infra.github.pr_state as pr_state
+
+    payloads = iter(
+        [
+            '{"state":"OPEN","mergeStateStatus":"BLOCKED"}',
+            '{"state":"OPEN","mergeStateStatus":"BLOCKED"}',
+            '{"state":"OPEN","mergeStateStatus":"BLOCKED"}',
+            '{"state":"OPEN","mergeStateStatus":"UNSTABLE"}',
+            '{"state":"OPEN","mergeStateStatus":"CLEAN"}',
+        ]
+    )
+    sleeps: list[float] = []
+
+    def fake_run_gh_process(_cmd: list[str], **_: object) -> Ok[str]:
+        return Ok(next(payloads))
+
+    def no_jitter(_a: float, _b: float) -> float:
+        return 0.0
+
+    monkeypatch.setattr(pr_state, "run_gh_process", fake_run_gh_process)
+    monkeypatch.setattr(pr_state.random, "uniform", no_jitter)
+    monkeypatch.setattr(pr_state.time, "sleep", sleeps.append)
+
+    result = wait_until_mergeable(
+        workspace_root=tmp_path,
+        repo_slug="owner/repo",
+        pr_url="https://example.invalid/pr/1",
+        repo_label="core",
+    )
+
+    assert isinstance(result, Ok)
+    assert sleeps == [2.0, 3.0, 4.5, 2.0]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+from ms.release.domain.open_control_models import OPEN_CONTROL_BOM_REPOS
+from ms.release.infra.open_control import collect_open_control_repos
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path, text=True).strip()
+
+
+def _init_repo(path: Path) -> str:
+    path.mkdir(parents=True)
+    _git(path, "init", "-q", "-b", "main")
+    _git(path, "config", "user.email", "test@example.invalid")
+    _git(path, "config", "user.name", "Test")
+    _git(path, "commit", "-q", "--allow-empty", "-m", "init")
+    return _git(path, "rev-parse", "HEAD")
+
+
+def test_collect_open_control_repos_reads_head_and_dirty_state(tmp_path: Path) -> None:
+    clean_name, dirty_name = OPEN_CONTROL_BOM_REPOS[:2]
+    clean_head = _init_repo(tmp_path / "open-control" / clean_name)
+    dirty_head = _init_repo(tmp_path / "open-control" / dirty_name)
+    (tmp_path / "open-control" / dirty_name / "untracked.txt").write_text("x")
+
+    states = {s.repo: s for s in collect_open_control_repos(workspace_root=tmp_path)}
+
+    assert [s.repo for s in states.values()] == list(OPEN_CONTROL_BOM_REPOS)
+    assert (states[clean_name].head_sha, states[clean_name].dirty) == (clean_head, False)
+    assert (states[dirty_name].head_sha, states[dirty_name].dirty) == (dirty_head, True)
+    missing = [s for s in states.values() if s.repo not in {clean_name, dirty_name}]
+    assert all(not s.exists and s.head_sha is None and not s.dirty for s in missing)
@@ -1,6 +1,9 @@
 # SPDX-License-Identifier: MIT
 """Tests for common checker utilities."""
 
+import os
+import subprocess
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -9,6 +12,7 @@ from ms.platform.detection import LinuxDistro, Platform
 from ms.services.checkers.common import (
     DefaultCommandRunner,
     Hints,
+    ProbeCache,
     first_line,
     format_version_triplet,
     get_platform_key,
@@ -169,6 +173,17 @@ macos = "Enable IAC Driver"
         hints = load_hints(toml_path)
         assert hints == Hints.empty()
 
+    def test_load_is_cached_until_file_changes(self, tmp_path: Path) -> None:
+        toml_path = tmp_path / "hints.toml"
+        toml_path.write_text('[tools.cmake]\ndebian = "apt install cmake"\n')
+
+        first = load_hints(toml_path)
+        assert load_hints(toml_path) is first
+
+        toml_path.write_text('[tools.cmake]\ndebian = "apt-get install cmake"\n')
+        os.utime(toml_path, ns=(1, 2_000_000_000))
+        assert load_hints(toml_path).get_tool_hint("cmake", "debian") == "apt-get install cmake"
+
     def test_load_empty_file(self, tmp_path: Path) -> None:
         toml_path = tmp_path / "empty.toml"
         toml_path.write_text("")
@@ -204,3 +219,67 @@ class TestDefaultCommandRunner:
         # This should raise FileNotFoundError
         with pytest.raises(FileNotFoundError):
             runner.run(["nonexistent_command_12345"])
+
+
+@dataclass
+class _CountingRunner:
+    returncode: int = 0
+    calls: int = 0
+
+    def run(
+        self, args: list[str], *, capture: bool = True, cwd: Path | None = None
+    ) -> subprocess.CompletedProcess[str]:
+        self.calls += 1
+        if self.returncode < 0:
+            raise FileNotFoundError(args[0])
+        return subprocess.CompletedProcess(args, self.returncode, f"call {self.calls}", "")
+
+
+class TestProbeCache:
+    """Tests for ProbeCache."""
+
+    def test_reuses_successful_result(self) -> None:
+        cache = ProbeCache()
+        runner = _CountingRunner()
+
+        first = cache.run(runner, ["git", "--version"])
+        second = cache.run(runner, ["git", "--version"])
+
+        assert runner.calls == 1
+        assert second.stdout == first.stdout
+
+    def test_failures_are_not_cached(self) -> None:
+        cache = ProbeCache()
+        runner = _CountingRunner(returncode=1)
+
+        cache.run(runner, ["uv", "--version"])
+        cache.run(runner, ["uv", "--version"])
+
+        assert runner.calls == 2
+
+    def test_raising_probe_is_retried(self) -> None:
+        cache = ProbeCache()
+        runner = _CountingRunner(returncode=-1)
+
+        for _ in range(2):
+            with pytest.raises(FileNotFoundError):
+                cache.run(runner, ["uv", "--version"])
+
+        assert runner.calls == 2
+
+    def test_keys_include_cwd(self, tmp_path: Path) -> None:
+        cache = ProbeCache()
+        runner = _CountingRunner()
+
+        cache.run(runner, ["git", "--version"])
+        cache.run(runner, ["git", "--version"], cwd=tmp_path)
+
+        assert runner.calls == 2
+
+    def test_separate_caches_do_not_share_results(self) -> None:
+        runner = _CountingRunner()
+
+        ProbeCache().run(runner, ["git", "--version"])
+        ProbeCache().run(runner, ["git", "--version"])
+
+        assert runner.calls == 2
@@ -143,6 +143,29 @@ class TestToolsCheckerBundledTool:
         assert result.status == CheckStatus.OK
         assert "cmake version 3.28.0" in result.message
 
+    def test_bundled_binary_probed_once_per_tool(self, tmp_path: Path) -> None:
+        cmake_bin = tmp_path / "tools" / "cmake" / "bin" / "cmake"
+        cmake_bin.parent.mkdir(parents=True)
+        cmake_bin.write_text("mock")
+
+        runner = MockCommandRunner({(str(cmake_bin), "--version"): (0, "cmake 3.28.0", "")})
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=runner,
+        )
+        tool = MagicMock()
+        tool.spec.id = "cmake"
+        tool.bin_path.return_value = cmake_bin
+
+        with patch("shutil.which") as which:
+            first = checker.check_bundled_tool(tool, ["--version"])
+            second = checker.check_bundled_tool(tool, ["--version"])
+
+        assert first.status == second.status == CheckStatus.OK
+        assert tool.bin_path.call_count == 1
+        which.assert_not_called()
+
     def test_bundled_tool_not_found_falls_back_to_path(self, tmp_path: Path) -> None:
         runner = MockCommandRunner(
             {
@@ -428,6 +451,78 @@ class TestToolsCheckerPythonDeps:
         assert result.status == CheckStatus.OK
         assert "synced" in result.message
 
+    @staticmethod
+    def _fresh_venv(workspace_root: Path, *, dev_scripts: tuple[str, ...]) -> None:
+        (workspace_root / "uv.lock").write_text("", encoding="utf-8")
+        (workspace_root / "pyproject.toml").write_text("", encoding="utf-8")
+        venv_cfg = workspace_root / ".venv" / "pyvenv.cfg"
+        venv_cfg.parent.mkdir()
+        venv_cfg.write_text("", encoding="utf-8")
+        newer = (workspace_root / "uv.lock").stat().st_mtime + 10
+        os.utime(venv_cfg, (newer, newer))
+        (workspace_root / ".venv" / "bin").mkdir()
+        for name in dev_scripts:
+            (workspace_root / ".venv" / "bin" / name).write_text("", encoding="utf-8")
+
+    def test_fresh_venv_skips_uv_sync_check(self, tmp_path: Path) -> None:
+        self._fresh_venv(tmp_path, dev_scripts=("pytest", "pyright"))
+
+        runner = MockCommandRunner()
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=runner,
+        )
+        with patch("shutil.which", return_value="/usr/bin/uv"):
+            result = checker.check_python_deps()
+
+        assert result.status == CheckStatus.OK
+        assert runner.calls == []
+
+    def test_fresh_venv_without_dev_extras_runs_uv_sync_check(self, tmp_path: Path) -> None:
+        self._fresh_venv(tmp_path, dev_scripts=("pytest",))
+
+        runner = MockCommandRunner(
+            {
+                ("uv", "sync", "--check", "--extra", "dev"): (1, "", "Would install: pyright"),
+            }
+        )
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=runner,
+        )
+        with patch("shutil.which", return_value="/usr/bin/uv"):
+            result = checker.check_python_deps()
+
+        assert result.status == CheckStatus.WARNING
+        assert runner.calls == [["uv", "sync", "--check", "--extra", "dev"]]
+
+    def test_stale_venv_runs_uv_sync_check(self, tmp_path: Path) -> None:
+        venv_cfg = tmp_path / ".venv" / "pyvenv.cfg"
+        venv_cfg.parent.mkdir()
+        venv_cfg.write_text("", encoding="utf-8")
+        (tmp_path / "uv.lock").write_text("", encoding="utf-8")
+        (tmp_path / "pyproject.toml").write_text("", encoding="utf-8")
+        older = (tmp_path / "uv.lock").stat().st_mtime - 10
+        os.utime(venv_cfg, (older, older))
+
+        runner = MockCommandRunner(
+            {
+                ("uv", "sync", "--check", "--extra", "dev"): (1, "", "Would update: foo"),
+            }
+        )
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=runner,
+        )
+        with patch("shutil.which", return_value="/usr/bin/uv"):
+            result = checker.check_python_deps()
+
+        assert result.status == CheckStatus.WARNING
+        assert runner.calls == [["uv", "sync", "--check", "--extra", "dev"]]
+
     def test_deps_not_synced(self, tmp_path: Path) -> None:
         runner = MockCommandRunner(
             {
@@ -502,6 +597,66 @@ class TestToolsCheckerHints:
         assert result.hint == "Download from https://git-scm.com"
 
 
+class TestToolsCheckerCheckAll:
+    """Tests for check_all method."""
+
+    def test_results_keep_declaration_order(self, tmp_path: Path) -> None:
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=MockCommandRunner(),
+        )
+        with patch("shutil.which", return_value=None):
+            results = checker.check_all()
+
+        assert [r.name for r in results] == [
+            "git",
+            "gh",
+            "uv",
+            "rustc",
+            "cargo",
+            "gh auth",
+            "python deps",
+            "cmake",
+            "ninja",
+            "bun",
+            "jdk",
+            "maven",
+            "platformio",
+        ]
+
+
+class TestToolsCheckerWhichCache:
+    """Tests for per-instance PATH lookup caching."""
+
+    def test_which_resolved_once_per_name(self, tmp_path: Path) -> None:
+        runner = MockCommandRunner(
+            {
+                ("gh", "--version"): (0, "gh version 2.40.0", ""),
+                ("gh", "auth", "status"): (0, "Logged in to github.com", ""),
+            }
+        )
+        checker = ToolsChecker(
+            platform=Platform.LINUX,
+            tools_dir=tmp_path / "tools",
+            runner=runner,
+        )
+        with patch("shutil.which", return_value="/usr/bin/gh") as which:
+            checker.check_system_tool("gh", ["--version"], required=False)
+            checker.check_gh_auth()
+
+        assert which.call_count == 1
+
+    def test_new_checker_sees_fresh_path(self, tmp_path: Path) -> None:
+        with patch("shutil.which", return_value=None):
+            first = ToolsChecker(platform=Platform.LINUX, tools_dir=tmp_path / "tools")
+            assert first.check_system_tool("git", None).status == CheckStatus.ERROR
+
+        with patch("shutil.which", return_value="/usr/bin/git"):
+            second = ToolsChecker(platform=Platform.LINUX, tools_dir=tmp_path / "tools")
+            assert second.check_system_tool("git", None).status == CheckStatus.OK
+
+
 class TestToolsCheckerFrozen:
     """Tests for dataclass immutability."""
 
@@ -191,3 +191,37 @@ class TestWorkspaceChecker:
         )
         result = checker.check_emsdk()
         assert result.status == CheckStatus.OK
+
+    def test_check_bitwig_extensions_configured(
+        self, temp_workspace: Workspace, tmp_path: Path
+    ) -> None:
+        ext_dir = tmp_path / "bitwig-ext"
+        ext_dir.mkdir()
+        checker = WorkspaceChecker(
+            workspace=temp_workspace,
+            platform=Platform.LINUX,
+            bitwig_paths={"linux": str(ext_dir)},
+        )
+        result = checker.check_bitwig_extensions()
+        assert result.status == CheckStatus.OK
+        assert result.message == str(ext_dir)
+
+    def test_check_bitwig_extensions_default_candidates(
+        self, temp_workspace: Workspace, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        home = tmp_path / "home"
+        monkeypatch.setattr(Path, "home", lambda: home)
+        checker = WorkspaceChecker(
+            workspace=temp_workspace,
+            platform=Platform.LINUX,
+        )
+
+        missing = checker.check_bitwig_extensions()
+        assert missing.status == CheckStatus.WARNING
+        assert str(home / "Bitwig Studio" / "Extensions") in missing.message
+
+        fallback = home / ".BitwigStudio" / "Extensions"
+        fallback.mkdir(parents=True)
+        found = checker.check_bitwig_extensions()
+        assert found.status == CheckStatus.OK
+        assert found.message == str(fallback)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import subprocess
 from pathlib import Path
 from typing import cast
 
-from ms.services.dist import generate_manifest, read_manifest
+import pytest
+
+from ms.services.dist import generate_manifest, read_manifest, write_text_atomic
 
 
 def test_generate_manifest_includes_assets_and_repos_lock(tmp_path: Path) -> None:
@@ -59,3 +63,220 @@ def test_generate_manifest_includes_assets_and_repos_lock(tmp_path: Path) -> Non
     assert cast(str, a["arch"]) == "x86_64"
     assert cast(int, a["size"]) == len(b"fakezip")
     assert isinstance(a["sha256"], str)
+
+
+def test_generate_manifest_sha256_matches_content(tmp_path: Path) -> None:
+    (tmp_path / "dist").mkdir()
+    payload = b"x" * (3 * 1024 * 1024 + 17)
+    (tmp_path / "dist" / "midi-studio-firmware-teensy.zip").write_bytes(payload)
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    assets = cast(list[dict[str, object]], read_manifest(out_path)["assets"])
+    assert cast(str, assets[0]["sha256"]) == hashlib.sha256(payload).hexdigest()
+    assert cast(int, assets[0]["size"]) == len(payload)
+
+
+def test_generate_manifest_lists_assets_in_sorted_order(tmp_path: Path) -> None:
+    (tmp_path / "dist").mkdir()
+    names = [
+        "midi-studio-wasm-core.zip",
+        "midi-studio-bitwig-extension.zip",
+        "midi-studio-linux-x86_64-native.zip",
+        "midi-studio-firmware-teensy.zip",
+    ]
+    for i, name in enumerate(names):
+        (tmp_path / "dist" / name).write_bytes(bytes([i]) * (i + 1))
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    assets = cast(list[dict[str, object]], read_manifest(out_path)["assets"])
+    assert [cast(str, a["filename"]) for a in assets] == sorted(names)
+    for a in assets:
+        data = (tmp_path / "dist" / cast(str, a["filename"])).read_bytes()
+        assert cast(str, a["sha256"]) == hashlib.sha256(data).hexdigest()
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path, text=True).strip()
+
+
+def test_generate_manifest_tracks_new_commits(tmp_path: Path) -> None:
+    (tmp_path / "dist").mkdir()
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.invalid")
+    _git(tmp_path, "config", "user.name", "Test")
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "first")
+
+    def manifest_sha() -> str:
+        out_path = generate_manifest(
+            workspace_root=tmp_path,
+            dist_dir=tmp_path / "dist",
+            channel="beta",
+            tag="v0.1.0-beta.1",
+            out_path=tmp_path / "dist" / "manifest.json",
+        )
+        return cast(str, read_manifest(out_path)["ms_dev_env_sha"])
+
+    assert manifest_sha() == _git(tmp_path, "rev-parse", "HEAD")
+    assert manifest_sha() == _git(tmp_path, "rev-parse", "HEAD")
+
+    _git(tmp_path, "commit", "-q", "--allow-empty", "-m", "second")
+    assert manifest_sha() == _git(tmp_path, "rev-parse", "HEAD")
+
+
+def test_generate_manifest_default_source_hash_is_stable(tmp_path: Path) -> None:
+    (tmp_path / ".ms").mkdir()
+    (tmp_path / "dist").mkdir()
+    repos = [
+        {"org": "open-control", "name": "bridge", "head_sha": "a" * 40},
+        {"org": "midi-studio", "name": "core", "head_sha": "b" * 40},
+    ]
+    (tmp_path / ".ms" / "repos.lock.json").write_text(json.dumps(repos), encoding="utf-8")
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    m = read_manifest(out_path)
+    expected = hashlib.sha256()
+    expected.update(cast(str, m["ms_dev_env_sha"]).encode("ascii"))
+    for r in repos:
+        expected.update(f"\n{r['org']}/{r['name']}@{r['head_sha']}".encode("ascii"))
+    assert m["source_hash"] == expected.hexdigest()
+
+
+def test_generate_manifest_ignores_undecodable_repos_lock(tmp_path: Path) -> None:
+    (tmp_path / ".ms").mkdir()
+    (tmp_path / "dist").mkdir()
+    (tmp_path / ".ms" / "repos.lock.json").write_bytes(b"\xff\xfe\xfa not json")
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    assert read_manifest(out_path)["repos"] == []
+
+
+def test_generate_manifest_writes_sorted_indented_json(tmp_path: Path) -> None:
+    (tmp_path / "dist").mkdir()
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+        source_hash="abc",
+    )
+
+    text = out_path.read_text(encoding="utf-8")
+    assert text == json.dumps(json.loads(text), indent=2, sort_keys=True) + "\n"
+
+
+def test_generate_manifest_classifies_known_assets(tmp_path: Path) -> None:
+    (tmp_path / "dist").mkdir()
+    for name in (
+        "midi-studio-wasm-core.zip",
+        "midi-studio-wasm-bitwig.zip",
+        "midi-studio-bitwig-extension.zip",
+        "midi-studio-firmware-teensy.zip",
+        "midi-studio-macos-arm64-native.zip",
+        "midi-studio-linux-x86_64-teensy-uploader.zip",
+        "midi-studio-linux-x86_64-other.zip",
+        "extra.zip",
+    ):
+        (tmp_path / "dist" / name).write_bytes(b"zip")
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    assets = cast(list[dict[str, object]], read_manifest(out_path)["assets"])
+    by_name = {cast(str, a["filename"]): (a["id"], a["kind"], a["os"], a["arch"]) for a in assets}
+    assert by_name == {
+        "midi-studio-wasm-core.zip": ("simulator_wasm_core", "simulator_wasm", None, None),
+        "midi-studio-wasm-bitwig.zip": ("simulator_wasm_bitwig", "simulator_wasm", None, None),
+        "midi-studio-bitwig-extension.zip": ("bitwig_extension", "extension", None, None),
+        "midi-studio-firmware-teensy.zip": ("firmware_teensy", "firmware", None, None),
+        "midi-studio-macos-arm64-native.zip": (
+            "bundle_native_macos_arm64",
+            "bundle_native",
+            "macos",
+            "arm64",
+        ),
+        "midi-studio-linux-x86_64-teensy-uploader.zip": (
+            "teensy_uploader_linux_x86_64",
+            "uploader",
+            "linux",
+            "x86_64",
+        ),
+        "midi-studio-linux-x86_64-other.zip": (
+            "asset_midi-studio-linux-x86_64-other.zip",
+            "unknown",
+            None,
+            None,
+        ),
+        "extra.zip": ("asset_extra.zip", "unknown", None, None),
+    }
+
+
+def test_write_text_atomic_replaces_without_leftovers(tmp_path: Path) -> None:
+    target = tmp_path / "manifest.json"
+    target.write_text("old", encoding="utf-8")
+
+    write_text_atomic(target, "new\n")
+
+    assert target.read_bytes() == b"new\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["manifest.json"]
+
+
+def test_generate_manifest_hashes_large_assets_via_mmap(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr("ms.services.dist._MMAP_HASH_MIN_BYTES", 1024)
+    (tmp_path / "dist").mkdir()
+    small = b"s" * 10
+    large = bytes(range(256)) * 64
+    (tmp_path / "dist" / "midi-studio-wasm-core.zip").write_bytes(small)
+    (tmp_path / "dist" / "midi-studio-wasm-bitwig.zip").write_bytes(large)
+
+    out_path = generate_manifest(
+        workspace_root=tmp_path,
+        dist_dir=tmp_path / "dist",
+        channel="beta",
+        tag="v0.1.0-beta.1",
+        out_path=tmp_path / "dist" / "manifest.json",
+    )
+
+    assets = cast(list[dict[str, object]], read_manifest(out_path)["assets"])
+    by_name = {cast(str, a["filename"]): a for a in assets}
+    core = by_name["midi-studio-wasm-core.zip"]
+    bitwig = by_name["midi-studio-wasm-bitwig.zip"]
+    assert core["sha256"] == hashlib.sha256(small).hexdigest()
+    assert bitwig["sha256"] == hashlib.sha256(large).hexdigest()
+    assert bitwig["size"] == len(large)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 from ms.platform.detection import Platform, detect
 from ms.services.dist import package_platform
@@ -34,3 +35,60 @@ def test_package_platform_handles_epoch_mtime(tmp_path: Path) -> None:
 
     # We should at least get the uploader bundle.
     assert any(p.name.endswith("-teensy-uploader.zip") for p in created)
+
+
+def test_package_platform_stores_precompressed_payloads(tmp_path: Path) -> None:
+    ext_path = tmp_path / "bin" / "bitwig" / "midi_studio.bwextension"
+    ext_path.parent.mkdir(parents=True)
+    ext_path.write_bytes(b"PK" + b"\0" * 64)
+    core_native = tmp_path / "bin" / "core" / "native"
+    core_native.mkdir(parents=True)
+    (core_native / "app.bin").write_bytes(b"\0" * 4096)
+
+    created = package_platform(
+        workspace_root=tmp_path,
+        out_dir=tmp_path / "dist",
+        include_extension=True,
+    )
+
+    ext_zip = next(p for p in created if p.name == "midi-studio-bitwig-extension.zip")
+    with ZipFile(ext_zip) as zf:
+        assert zf.getinfo("bitwig/midi_studio.bwextension").compress_type == ZIP_STORED
+
+    native_zip = next(p for p in created if p.name.endswith("-native.zip"))
+    with ZipFile(native_zip) as zf:
+        assert zf.getinfo("core/native/app.bin").compress_type == ZIP_DEFLATED
+        assert zf.read("core/native/app.bin") == b"\0" * 4096
+
+
+def test_package_platform_native_bundle_walks_tree_with_excludes(tmp_path: Path) -> None:
+    base = tmp_path / "bin" / "core" / "native"
+    (base / "sub" / "deep").mkdir(parents=True)
+    (base / "sub-dir").mkdir()
+    (base / "app").write_bytes(b"a")
+    (base / "app.pdb").write_bytes(b"d")
+    (base / "macros.bin").write_bytes(b"m")
+    (base / "sub" / "deep" / "lib.so").write_bytes(b"l")
+    (base / "sub-dir" / "res.dat").write_bytes(b"r")
+    (base / "sub" / "z.txt").write_bytes(b"z")
+
+    created = package_platform(workspace_root=tmp_path, out_dir=tmp_path / "dist")
+
+    native_zip = next(p for p in created if p.name.endswith("-native.zip"))
+    with ZipFile(native_zip) as zf:
+        assert zf.namelist() == [
+            "core/native/app",
+            "core/native/sub/deep/lib.so",
+            "core/native/sub/z.txt",
+            "core/native/sub-dir/res.dat",
+        ]
+
+
+def test_package_platform_skips_native_input_that_is_not_a_directory(tmp_path: Path) -> None:
+    native = tmp_path / "bin" / "core" / "native"
+    native.parent.mkdir(parents=True)
+    native.write_bytes(b"not a directory")
+
+    created = package_platform(workspace_root=tmp_path, out_dir=tmp_path / "dist")
+
+    assert not any(p.name.endswith("-native.zip") for p in created)
@@ -81,3 +81,85 @@ def test_hardware_build_dry_run_skips_subprocess(
     result = svc.build(app, env="dev", dry_run=True)
     assert result.is_ok()
     assert called["n"] == 0
+
+
+def test_hardware_build_env_resolved_once_per_service(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    ws = Workspace(root=tmp_path)
+    app_dir = tmp_path / "midi-studio" / "core"
+    app_dir.mkdir(parents=True)
+    (app_dir / "platformio.ini").write_text("[platformio]\ndefault_envs = dev\n", encoding="utf-8")
+    app = App(name="core", path=app_dir, has_teensy=True)
+
+    calls = {"n": 0}
+    envs: list[dict[str, str]] = []
+    original = Workspace.platformio_env_vars
+
+    def counting_env_vars(self: Workspace) -> dict[str, str]:
+        calls["n"] += 1
+        return original(self)
+
+    def fake_run(
+        cmd: list[str], *, cwd: Path, env: dict[str, str]
+    ) -> subprocess.CompletedProcess[str]:
+        envs.append(env)
+        return subprocess.CompletedProcess(args=cmd, returncode=0)
+
+    monkeypatch.setenv("MS_TEST_MARKER", "1")
+    monkeypatch.setattr(Workspace, "platformio_env_vars", counting_env_vars)
+    monkeypatch.setattr("ms.services.hardware.subprocess.run", fake_run)
+
+    svc = HardwareService(workspace=ws, platform=_platform(), config=None, console=MockConsole())
+    svc.build(app, env="dev")
+    svc.upload(app, env="dev")
+    svc.monitor(app, env="dev")
+    assert calls["n"] == 1
+    assert len(envs) == 3
+    assert all(env is envs[0] for env in envs)
+    assert envs[0]["MS_TEST_MARKER"] == "1"
+    assert "PLATFORMIO_CORE_DIR" in envs[0]
+
+
+def test_hardware_build_skips_unchanged_firmware_export(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+    import shutil
+
+    ws = Workspace(root=tmp_path)
+    app_dir = tmp_path / "midi-studio" / "core"
+    app_dir.mkdir(parents=True)
+    (app_dir / "platformio.ini").write_text("[platformio]\ndefault_envs = dev\n", encoding="utf-8")
+    fw = app_dir / ".pio" / "build" / "dev" / "firmware.hex"
+    fw.parent.mkdir(parents=True)
+    fw.write_bytes(b"deadbeef")
+    app = App(name="core", path=app_dir, has_teensy=True)
+
+    def fake_run(
+        cmd: list[str], *, cwd: Path, env: dict[str, str]
+    ) -> subprocess.CompletedProcess[str]:
+        return subprocess.CompletedProcess(args=cmd, returncode=0)
+
+    copies: list[Path] = []
+    real_copy2 = shutil.copy2
+
+    def counting_copy2(src: Path, dst: Path) -> object:
+        copies.append(dst)
+        return real_copy2(src, dst)
+
+    monkeypatch.setattr("ms.services.hardware.subprocess.run", fake_run)
+    monkeypatch.setattr("ms.services.hardware.exporter.shutil.copy2", counting_copy2)
+
+    svc = HardwareService(workspace=ws, platform=_platform(), config=None, console=MockConsole())
+    assert svc.build(app, env="dev").is_ok()
+    assert svc.build(app, env="dev").is_ok()
+    assert len(copies) == 1
+
+    fw.write_bytes(b"cafebabe00")
+    os.utime(fw, ns=(1, 2_000_000_000))
+    assert svc.build(app, env="dev").is_ok()
+    assert len(copies) == 2
+    assert (tmp_path / "bin" / "core" / "teensy" / "dev" / "firmware.hex").read_bytes() == (
+        b"cafebabe00"
+    )
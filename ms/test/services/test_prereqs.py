@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from ms.core.workspace import Workspace
+from ms.output.console import MockConsole
+from ms.platform.detection import Arch, LinuxDistro, Platform, PlatformInfo
+from ms.services.checkers import SystemChecker, ToolsChecker
+from ms.services.checkers.base import CheckResult
+from ms.services.prereqs import PrereqsService
+
+
+def _service(tmp_path: Path, console: MockConsole | None = None) -> PrereqsService:
+    return PrereqsService(
+        workspace=Workspace(root=tmp_path),
+        platform=PlatformInfo(platform=Platform.LINUX, arch=Arch.X64, distro=LinuxDistro.DEBIAN),
+        config=None,
+        console=console or MockConsole(),
+    )
+
+
+def test_ensure_reports_system_then_tool_issues_in_order(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    def fake_check_all(self: SystemChecker) -> list[CheckResult]:
+        return [
+            CheckResult.success("pkg-config", "ok"),
+            CheckResult.error("libasound2-dev", "missing"),
+            CheckResult.warning("udev rules", "missing"),
+        ]
+
+    def fake_check_system_tool(
+        self: ToolsChecker,
+        name: str,
+        version_args: list[str] | None = None,
+        *,
+        required: bool = True,
+    ) -> CheckResult:
+        if name == "uv":
+            return CheckResult.success("uv", "1.0")
+        return CheckResult.error(name, "missing")
+
+    monkeypatch.setattr(SystemChecker, "check_all", fake_check_all)
+    monkeypatch.setattr(ToolsChecker, "check_system_tool", fake_check_system_tool)
+
+    console = MockConsole()
+    result = _service(tmp_path, console).ensure(
+        require_git=True,
+        require_uv=True,
+        install=False,
+        dry_run=False,
+        assume_yes=False,
+        fail_if_missing=True,
+    )
+
+    assert result.is_err()
+    errors = [m for m in console.messages if m.startswith("  ")]
+    assert errors == ["  libasound2-dev: missing", "  git: missing"]
+
+
+def test_ensure_skips_tool_probes_that_are_not_required(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    probed: list[str] = []
+
+    def fake_check_all(self: SystemChecker) -> list[CheckResult]:
+        return []
+
+    def fake_check_system_tool(
+        self: ToolsChecker,
+        name: str,
+        version_args: list[str] | None = None,
+        *,
+        required: bool = True,
+    ) -> CheckResult:
+        probed.append(name)
+        return CheckResult.success(name, "ok")
+
+    monkeypatch.setattr(SystemChecker, "check_all", fake_check_all)
+    monkeypatch.setattr(ToolsChecker, "check_system_tool", fake_check_system_tool)
+
+    result = _service(tmp_path).ensure(
+        require_git=True,
+        require_uv=False,
+        install=False,
+        dry_run=False,
+        assume_yes=False,
+        fail_if_missing=True,
+    )
+
+    assert result.is_ok()
+    assert probed == ["git"]